@@ -4,16 +4,79 @@ Simple wrapper to make the competitive system frontend-ready
 """
 
 import asyncio
+import copy
 import json
+import os
+import random
 import time
+import traceback
 from typing import Dict, Any, List
 from main_competitive import CompetitivePMSimulator
+from src.core.competitive_workflow import PROGRESS_MESSAGE_POOLS
+from src.core.event_loop import get_loop_factory
+from src.core.letta_utils import first_content, loads_content
+from src.core.logger import configure_console
+
+_FRONTEND_AGENTS = ("One", "Two", "Three", "Four")
+_AGENT_ENV_KEYS = {
+    "One": "LETTA_AGENT_ONE",
+    "Two": "LETTA_AGENT_TWO",
+    "Three": "LETTA_AGENT_THREE",
+    "Four": "LETTA_AGENT_FOUR",
+    "Commentator": "LETTA_AGENT_COMMENTATOR",
+    "Orchestrator": "LETTA_AGENT_ORCHESTRATOR"
+}
+
+# Static roster shown by the frontend - built once at import
+_AGENTS_INFO = {
+    "success": True,
+    "message": "Retrieved 4 competitive agents",
+    "agents": [
+        { 
+            "name": "Speedrunner",
+            "personality": "Fast, competitive, efficiency-focused",
+            "strengths": ["Performance", "Speed", "Optimization", "Delivery", "React"],
+            "coding_style": "fast, competitive, efficiency-focused"
+        },
+        {
+            "name": "Bloom", 
+            "personality": "Creative, scattered, pattern-seeking",
+            "strengths": ["Design", "UI/UX", "Accessibility", "User experience", "CSS"],
+            "coding_style": "creative, scattered, pattern-seeking"
+        },
+        {
+            "name": "Solver",
+            "personality": "Logical, methodical, puzzle-driven",
+            "strengths": ["Problem Solving", "Logic", "Mathematics", "Algorithms", "Data Structures"],
+            "coding_style": "Logical, methodical, puzzle-driven"
+        },
+        {
+            "name": "Loader",
+            "personality": "Patient, steady, process-oriented",
+            "strengths": ["Quality", "Reliability", "Completeness", "Documentation", "Testing"],
+            "coding_style": "Patient, steady, process-oriented"
+        }
+    ]
+}
 
 class CompetitiveAPI:
     """Simple API wrapper for frontend integration."""
     
     def __init__(self):
         self.simulator = CompetitivePMSimulator()
+        
+        # Resolve Letta agent IDs from the environment once instead of per request
+        self.agent_ids = {name: os.environ.get(env_key) for name, env_key in _AGENT_ENV_KEYS.items()}
+        self.competitor_ids = {name: self.agent_ids[name] for name in _FRONTEND_AGENTS}
+    
+    @staticmethod
+    def _assistant_replies(response) -> List[str]:
+        """Assistant message contents from a Letta messages.create response, newest first."""
+        return [
+            message.content if hasattr(message, 'content') else str(message)
+            for message in reversed(getattr(response, 'messages', None) or [])
+            if getattr(message, 'message_type', None) == 'assistant_message'
+        ]
     
     async def run_single_round(self, subtask: str) -> Dict[str, Any]:
         """Run a single competitive round - PERFECT for frontend."""
@@ -85,129 +148,25 @@ class CompetitiveAPI:
                 "winner": "Unknown",
                 "timestamp": time.time()
             }
+        finally:
+            # Each request runs on its own loop, so release the loop-bound async Letta client with it
+            await self.simulator.workflow.close_async_client()
     
     async def get_agents_info(self) -> Dict[str, Any]:
         """Get information about all 4 competitive agents."""
-        return {
-            "success": True,
-            "message": "Retrieved 4 competitive agents",
-            "agents": [
-                { 
-                    "name": "Speedrunner",
-                    "personality": "Fast, competitive, efficiency-focused",
-                    "strengths": ["Performance", "Speed", "Optimization", "Delivery", "React"],
-                    "coding_style": "fast, competitive, efficiency-focused"
-                },
-                {
-                    "name": "Bloom", 
-                    "personality": "Creative, scattered, pattern-seeking",
-                    "strengths": ["Design", "UI/UX", "Accessibility", "User experience", "CSS"],
-                    "coding_style": "creative, scattered, pattern-seeking"
-                },
-                {
-                    "name": "Solver",
-                    "personality": "Logical, methodical, puzzle-driven",
-                    "strengths": ["Problem Solving", "Logic", "Mathematics", "Algorithms", "Data Structures"],
-                    "coding_style": "Logical, methodical, puzzle-driven"
-                },
-                {
-                    "name": "Loader",
-                    "personality": "Patient, steady, process-oriented",
-                    "strengths": ["Quality", "Reliability", "Completeness", "Documentation", "Testing"],
-                    "coding_style": "Patient, steady, process-oriented"
-                }
-            ]
-        }
+        # Hand out a copy so a caller editing the response can't change what later requests see
+        return copy.deepcopy(_AGENTS_INFO)
 
     def get_generic_progress_messages(self) -> Dict[str, List[str]]:
         """Get generic progress messages for frontend simulation."""
-        import random
-        
         # Same message pool as the backend
-        start_messages = [
-            "🔥 Starting work - time to show these amateurs how it's done!",
-            "⚡ INITIATING PROTOCOL - building something that actually works!",
-            "🎯 Mission accepted - time to drop some knowledge bombs!",
-            "🚀 Launching into battle - let's see who's really the GOAT!",
-            "💥 Entering the arena - prepare for some next-level coding!",
-            "🔥 Warming up the engines - this is about to get SPICY!",
-            "⚡ Activating beast mode - time to show what real skill looks like!",
-            "🎯 Locking and loading - prepare for some fire code!",
-            "🚀 Igniting the rockets - let's see who can keep up!",
-            "💥 Dropping into the zone - this is where legends are made!"
-        ]
-        
-        progress_messages = [
-            "⚡ Implementing core functionality - building something that actually works!",
-            "🎯 Adding the magic sauce - making this bulletproof!",
-            "🔥 Crafting the perfect solution - no compromises!",
-            "⚡ Optimizing for performance - speed is everything!",
-            "🎯 Adding defensive programming - bulletproofing this beast!",
-            "🔥 Implementing type safety - no runtime surprises!",
-            "⚡ Adding accessibility features - inclusive by design!",
-            "🎯 Writing comprehensive tests - quality first!",
-            "🔥 Adding error handling - graceful failures only!",
-            "⚡ Optimizing the architecture - scalable and maintainable!",
-            "🎯 Adding documentation - future devs will thank me!",
-            "🔥 Implementing best practices - this is how it's done!",
-            "⚡ Adding performance optimizations - blazing fast!",
-            "🎯 Creating reusable components - DRY principle!",
-            "🔥 Adding security measures - locked down tight!"
-        ]
-        
-        polish_messages = [
-            "🎯 Adding polish and testing - making this bulletproof!",
-            "🔥 Final touches - perfection is in the details!",
-            "⚡ Adding the finishing touches - this is art!",
-            "🎯 Quality assurance complete - bulletproof!",
-            "🔥 Adding the secret sauce - this is next level!",
-            "⚡ Final optimizations - peak performance achieved!",
-            "🎯 Code review complete - this is flawless!",
-            "🔥 Adding the cherry on top - masterpiece complete!",
-            "⚡ Final testing phase - everything checks out!",
-            "🎯 Documentation finalized - future-proofed!",
-            "🔥 Performance tuning complete - lightning fast!",
-            "⚡ Security audit passed - locked down!",
-            "🎯 Accessibility verified - inclusive design!",
-            "🔥 Code cleanup done - pristine and clean!",
-            "⚡ Final validation - this is production ready!"
-        ]
-        
-        completion_messages = [
-            "🏆 Completed - another victory for the GOAT!",
-            "🔥 Mission accomplished - that's how you do it!",
-            "⚡ Victory achieved - another flawless execution!",
-            "🎯 Task completed - perfection delivered!",
-            "🔥 Another win in the books - unstoppable!",
-            "⚡ Mission successful - that's championship level!",
-            "🎯 Objective achieved - another masterpiece!",
-            "🔥 Victory secured - the GOAT strikes again!",
-            "⚡ Task completed - flawless execution!",
-            "🎯 Mission accomplished - that's skill!",
-            "🔥 Another victory - this is my domain!",
-            "⚡ Objective completed - perfection achieved!",
-            "🎯 Task finished - another masterpiece delivered!",
-            "🔥 Victory achieved - unstoppable force!",
-            "⚡ Mission complete - that's how legends are made!"
-        ]
-        
-        # Generate random messages for each agent
-        agents = ["One", "Two", "Three", "Four"]
-        planned_messages = {}
-        
-        for agent in agents:
-            planned_messages[agent] = [
-                random.choice(start_messages),
-                random.choice(progress_messages),
-                random.choice(polish_messages),
-                random.choice(completion_messages)
-            ]
-        
-        return planned_messages
+        return {
+            agent: [random.choice(pool) for pool in PROGRESS_MESSAGE_POOLS.values()]
+            for agent in _FRONTEND_AGENTS
+        }
 
     async def submit_project(self, project_description: str) -> Dict[str, Any]:
         """Submit a project description and get subtasks."""
-        import time
         project_id = f"project_{int(time.time())}"
         
         # Create simple subtasks based on project description
@@ -250,19 +209,11 @@ class CompetitiveAPI:
             print(f"🔄 Sending context reset to existing Letta agents for project: {project_id}")
             
             # Use the specific agent IDs from .env
-            import os
-            agent_ids = {
-                "One": os.getenv("LETTA_AGENT_ONE"),
-                "Two": os.getenv("LETTA_AGENT_TWO"), 
-                "Three": os.getenv("LETTA_AGENT_THREE"),
-                "Four": os.getenv("LETTA_AGENT_FOUR"),
-                "Commentator": os.getenv("LETTA_AGENT_COMMENTATOR"),
-                "Orchestrator": os.getenv("LETTA_AGENT_ORCHESTRATOR")
-            }
+            agent_ids = self.agent_ids
             
             print(f"📡 Found {len(agent_ids)} agents from .env")
             
-            # Send context reset message to each agent
+            # Build a context reset message for each agent
             reset_messages = []
             for agent_name, agent_id in agent_ids.items():
                 if not agent_id:
@@ -271,19 +222,25 @@ class CompetitiveAPI:
                     
                 print(f"🔄 Resetting context for agent: {agent_name} ({agent_id})")
                 
-                # Send context reset message
-                reset_message = f"Context reset for project: {project_id}. You are {agent_name}. Ready for new task."
-                
-                # Send actual message to Letta agent
-                self.simulator.client.agents.messages.create(agent_id, messages=[{"role": "user", "content": reset_message}])
-                
                 reset_messages.append({
                     "agent_name": agent_name,
                     "agent_id": agent_id,
-                    "message": reset_message,
+                    "message": f"Context reset for project: {project_id}. You are {agent_name}. Ready for new task.",
                     "status": "context_reset"
                 })
             
+            # Send the actual messages to the Letta agents concurrently on the shared pool
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*(
+                loop.run_in_executor(
+                    self.simulator.letta_executor,
+                    lambda reset=reset: self.simulator.client.agents.messages.create(
+                        reset["agent_id"], messages=[{"role": "user", "content": reset["message"]}]
+                    )
+                )
+                for reset in reset_messages
+            ))
+            
             print(f"✅ Context reset sent to {len(reset_messages)} agents")
             return {
                 "success": True,
@@ -294,7 +251,6 @@ class CompetitiveAPI:
             }
         except Exception as e:
             print(f"❌ Error resetting agent context: {str(e)}")
-            import traceback
             traceback.print_exc()
             return {
                 "success": False,
@@ -388,13 +344,7 @@ class CompetitiveAPI:
             print(f"📝 Subtask description: {current_subtask['description']}")
             
             # Step 2: Use the specific agent IDs from .env
-            import os
-            agent_ids = {
-                "One": os.getenv("LETTA_AGENT_ONE"),
-                "Two": os.getenv("LETTA_AGENT_TWO"), 
-                "Three": os.getenv("LETTA_AGENT_THREE"),
-                "Four": os.getenv("LETTA_AGENT_FOUR")
-            }
+            agent_ids = self.competitor_ids
             
             print(f"📡 Found {len(agent_ids)} agents from .env")
             
@@ -466,7 +416,6 @@ console.log('Agent {agent_name} is working on: {current_subtask["title"]}');"""
             }
         except Exception as e:
             print(f"❌ Error sending subtask to agents: {str(e)}")
-            import traceback
             traceback.print_exc()
             return {
                 "success": False,
@@ -479,7 +428,6 @@ console.log('Agent {agent_name} is working on: {current_subtask["title"]}');"""
         try:
             # Try to read from artifacts first
             artifacts_path = f"artifacts/{project_id}/{agent_id}/round_{subtask_id}/code.tsx"
-            import os
             if os.path.exists(artifacts_path):
                 with open(artifacts_path, 'r') as f:
                     return f.read()
@@ -520,13 +468,7 @@ export default GeneratedComponent;"""
             print(f"📥 Retrieving code from agent: {agent_name}")
             
             # Get agent ID from .env
-            import os
-            agent_ids = {
-                "One": os.getenv("LETTA_AGENT_ONE"),
-                "Two": os.getenv("LETTA_AGENT_TWO"), 
-                "Three": os.getenv("LETTA_AGENT_THREE"),
-                "Four": os.getenv("LETTA_AGENT_FOUR")
-            }
+            agent_ids = self.competitor_ids
             
             agent_id = agent_ids.get(agent_name)
             if not agent_id:
@@ -598,7 +540,6 @@ export default GeneratedComponent;"""
                 
         except Exception as e:
             print(f"❌ Error retrieving code from {agent_name}: {str(e)}")
-            import traceback
             traceback.print_exc()
             return {
                 "success": False,
@@ -613,13 +554,7 @@ export default GeneratedComponent;"""
             print(f"📥 Getting all messages from agent: {agent_name}")
             
             # Get agent ID from .env
-            import os
-            agent_ids = {
-                "One": os.getenv("LETTA_AGENT_ONE"),
-                "Two": os.getenv("LETTA_AGENT_TWO"), 
-                "Three": os.getenv("LETTA_AGENT_THREE"),
-                "Four": os.getenv("LETTA_AGENT_FOUR")
-            }
+            agent_ids = self.competitor_ids
             
             agent_id = agent_ids.get(agent_name)
             if not agent_id:
@@ -665,7 +600,6 @@ export default GeneratedComponent;"""
                 
         except Exception as e:
             print(f"❌ Error getting messages from {agent_name}: {str(e)}")
-            import traceback
             traceback.print_exc()
             return {
                 "success": False,
@@ -680,8 +614,7 @@ export default GeneratedComponent;"""
             print(f"🎙️ Getting commentary for project: {project_id}")
             
             # Get commentator agent ID from .env
-            import os
-            commentator_id = os.getenv("LETTA_AGENT_COMMENTATOR")
+            commentator_id = self.agent_ids["Commentator"]
             if not commentator_id:
                 return {
                     "success": False,
@@ -702,23 +635,11 @@ Provide engaging commentary on:
 Keep it engaging and use emojis! Make it 2-3 sentences.
 """
             
-            # Send prompt to commentator
-            self.simulator.client.agents.messages.create(commentator_id, messages=[{"role": "user", "content": commentary_prompt}])
+            # Send prompt to commentator - the reply comes back on the create response itself
+            response = self.simulator.client.agents.messages.create(commentator_id, messages=[{"role": "user", "content": commentary_prompt}])
             
-            # Wait for response
-            import time
-            time.sleep(3)
-            
-            # Get response
-            messages_response = self.simulator.client.agents.messages.list(commentator_id)
-            messages = messages_response.data if hasattr(messages_response, 'data') else messages_response
-            
-            commentary = "🎙️ Commentary unavailable at the moment"
-            if messages:
-                for message in reversed(messages):
-                    if hasattr(message, 'message_type') and message.message_type == 'assistant_message':
-                        commentary = message.content if hasattr(message, 'content') else str(message)
-                        break
+            replies = self._assistant_replies(response)
+            commentary = replies[0] if replies else "🎙️ Commentary unavailable at the moment"
             
             return {
                 "success": True,
@@ -742,8 +663,7 @@ Keep it engaging and use emojis! Make it 2-3 sentences.
             print(f"📝 Getting chat summary for project: {project_id}")
             
             # Get commentator agent ID from .env
-            import os
-            commentator_id = os.getenv("LETTA_AGENT_COMMENTATOR")
+            commentator_id = self.agent_ids["Commentator"]
             if not commentator_id:
                 return {
                     "success": False,
@@ -764,23 +684,11 @@ Provide a summary covering:
 Format: 1-2 sentences per section. Use emojis!
 """
             
-            # Send prompt to commentator
-            self.simulator.client.agents.messages.create(commentator_id, messages=[{"role": "user", "content": summary_prompt}])
-            
-            # Wait for response
-            import time
-            time.sleep(3)
-            
-            # Get response
-            messages_response = self.simulator.client.agents.messages.list(commentator_id)
-            messages = messages_response.data if hasattr(messages_response, 'data') else messages_response
+            # Send prompt to commentator - the reply comes back on the create response itself
+            response = self.simulator.client.agents.messages.create(commentator_id, messages=[{"role": "user", "content": summary_prompt}])
             
-            summary = "📝 Chat summary unavailable at the moment"
-            if messages:
-                for message in reversed(messages):
-                    if hasattr(message, 'message_type') and message.message_type == 'assistant_message':
-                        summary = message.content if hasattr(message, 'content') else str(message)
-                        break
+            replies = self._assistant_replies(response)
+            summary = replies[0] if replies else "📝 Chat summary unavailable at the moment"
             
             return {
                 "success": True,
@@ -804,8 +712,7 @@ Format: 1-2 sentences per section. Use emojis!
             print(f"🎯 Orchestrating project: {project_description}")
             
             # Get orchestrator agent ID from .env
-            import os
-            orchestrator_id = os.getenv("LETTA_AGENT_ORCHESTRATOR")
+            orchestrator_id = self.agent_ids["Orchestrator"]
             if not orchestrator_id:
                 return {
                     "success": False,
@@ -830,28 +737,16 @@ Keep it SIMPLE! No complex backend, no authentication, no deployment!
 Return ONLY the JSON array, no other text.
 """
             
-            # Send prompt to orchestrator
-            self.simulator.client.agents.messages.create(orchestrator_id, messages=[{"role": "user", "content": orchestration_prompt}])
-            
-            # Wait for response
-            import time
-            time.sleep(5)
-            
-            # Get response
-            messages_response = self.simulator.client.agents.messages.list(orchestrator_id)
-            messages = messages_response.data if hasattr(messages_response, 'data') else messages_response
+            # Send prompt to orchestrator - the reply comes back on the create response itself
+            response = self.simulator.client.agents.messages.create(orchestrator_id, messages=[{"role": "user", "content": orchestration_prompt}])
             
             subtasks = []
-            if messages:
-                for message in reversed(messages):
-                    if hasattr(message, 'message_type') and message.message_type == 'assistant_message':
-                        content = message.content if hasattr(message, 'content') else str(message)
-                        try:
-                            import json
-                            subtasks = json.loads(content)
-                            break
-                        except:
-                            continue
+            for content in self._assistant_replies(response):
+                try:
+                    subtasks = loads_content(content)
+                    break
+                except:
+                    continue
             
             if not subtasks:
                 # Fallback subtasks
@@ -899,13 +794,7 @@ Return ONLY the JSON array, no other text.
             print(f"📝 Reason: {reason}")
             
             # Get all agent IDs
-            import os
-            agent_ids = {
-                "One": os.getenv("LETTA_AGENT_ONE"),
-                "Two": os.getenv("LETTA_AGENT_TWO"), 
-                "Three": os.getenv("LETTA_AGENT_THREE"),
-                "Four": os.getenv("LETTA_AGENT_FOUR")
-            }
+            agent_ids = self.competitor_ids
             
             # Notify all agents about the winner
             notifications = []
@@ -1013,15 +902,7 @@ Return ONLY the JSON array, no other text.
         """Direct 1-on-1 conversation between two agents using Letta's multi-agent messaging."""
         try:
             # Get agent IDs from environment
-            import os
-            agent_ids = {
-                "One": os.getenv('LETTA_AGENT_ONE'),
-                "Two": os.getenv('LETTA_AGENT_TWO'),
-                "Three": os.getenv('LETTA_AGENT_THREE'),
-                "Four": os.getenv('LETTA_AGENT_FOUR'),
-                "Commentator": os.getenv('LETTA_AGENT_COMMENTATOR'),
-                "Orchestrator": os.getenv('LETTA_AGENT_ORCHESTRATOR')
-            }
+            agent_ids = self.agent_ids
 
             from_agent_id = agent_ids.get(from_agent)
             to_agent_id = agent_ids.get(to_agent)
@@ -1055,10 +936,10 @@ Then use the send_message_to_agent_and_wait_for_reply tool to send your message
             # Extract the conversation thread
             conversation = []
             for msg in response.messages:
-                if hasattr(msg, 'content') and msg.content:
+                if content := getattr(msg, 'content', None):
                     conversation.append({
                         "speaker": from_agent,
-                        "content": msg.content,
+                        "content": content,
                         "timestamp": time.time()
                     })
 
@@ -1069,10 +950,11 @@ Then use the send_message_to_agent_and_wait_for_reply tool to send your message
                 target_messages = self.simulator.client.agents.messages.list(to_agent_id, limit=5)
 
                 for msg in target_messages.messages[-2:]:  # Check last 2 messages
-                    if hasattr(msg, 'content') and msg.content and from_agent.lower() in msg.content.lower():
+                    content = getattr(msg, 'content', None)
+                    if content and from_agent.lower() in content.lower():
                         conversation.append({
                             "speaker": to_agent,
-                            "content": msg.content,
+                            "content": content,
                             "timestamp": time.time()
                         })
                         break
@@ -1100,15 +982,7 @@ Then use the send_message_to_agent_and_wait_for_reply tool to send your message
         """Group discussion between multiple agents."""
         try:
             # Get agent IDs from environment
-            import os
-            agent_ids = {
-                "One": os.getenv('LETTA_AGENT_ONE'),
-                "Two": os.getenv('LETTA_AGENT_TWO'),
-                "Three": os.getenv('LETTA_AGENT_THREE'),
-                "Four": os.getenv('LETTA_AGENT_FOUR'),
-                "Commentator": os.getenv('LETTA_AGENT_COMMENTATOR'),
-                "Orchestrator": os.getenv('LETTA_AGENT_ORCHESTRATOR')
-            }
+            agent_ids = self.agent_ids
 
             print(f"👥 Group chat: {', '.join(agent_names)}")
             print(f"💭 Topic: {topic}")
@@ -1152,10 +1026,10 @@ Be true to your personality and coding style.
 
                 # Extract agent's contribution
                 for msg in response.messages:
-                    if hasattr(msg, 'content') and msg.content:
+                    if content := getattr(msg, 'content', None):
                         conversation.append({
                             "speaker": agent_name,
-                            "content": msg.content,
+                            "content": content,
                             "timestamp": time.time()
                         })
                         break
@@ -1181,33 +1055,24 @@ Be true to your personality and coding style.
         """Generate trash talk and competitive banter between agents."""
         try:
             # Get agent IDs from environment
-            import os
-            agent_ids = {
-                "One": os.getenv('LETTA_AGENT_ONE'),
-                "Two": os.getenv('LETTA_AGENT_TWO'),
-                "Three": os.getenv('LETTA_AGENT_THREE'),
-                "Four": os.getenv('LETTA_AGENT_FOUR')
-            }
+            agent_ids = self.competitor_ids
 
             print(f"🔥 Battle trash talk - Event: {trigger_event}")
             print(f"⚔️ Context: {battle_context}")
 
-            trash_talk = []
+            # Create competitive banter context once - it's the same for every agent
+            context_parts = []
+            if battle_context.get("current_leader"):
+                context_parts.append(f"Current leader: {battle_context['current_leader']}. ")
+            if battle_context.get("round_number"):
+                context_parts.append(f"Round {battle_context['round_number']}. ")
+            if battle_context.get("task_difficulty"):
+                context_parts.append(f"Task difficulty: {battle_context['task_difficulty']}. ")
+            context_info = "".join(context_parts)
 
-            for agent_name in ["One", "Two", "Three", "Four"]:
-                agent_id = agent_ids.get(agent_name)
-                if not agent_id:
-                    continue
-
-                # Create competitive banter prompt based on event and context
-                context_info = ""
-                if battle_context.get("current_leader"):
-                    context_info += f"Current leader: {battle_context['current_leader']}. "
-                if battle_context.get("round_number"):
-                    context_info += f"Round {battle_context['round_number']}. "
-                if battle_context.get("task_difficulty"):
-                    context_info += f"Task difficulty: {battle_context['task_difficulty']}. "
+            speakers = [(agent_name, agent_ids[agent_name]) for agent_name in _FRONTEND_AGENTS if agent_ids.get(agent_name)]
 
+            def generate_banter(agent_name: str, agent_id: str):
                 banter_prompt = f"""
 You are {agent_name}, a competitive coding agent in a high-stakes coding battle.
 
@@ -1226,21 +1091,29 @@ Examples of your style:
 Make it entertaining for spectators!
 """
 
-                response = self.simulator.client.agents.messages.create(
+                return self.simulator.client.agents.messages.create(
                     agent_id=agent_id,
                     messages=[{"role": "user", "content": banter_prompt}]
                 )
 
-                # Extract trash talk
-                for msg in response.messages:
-                    if hasattr(msg, 'content') and msg.content:
-                        trash_talk.append({
-                            "agent": agent_name,
-                            "message": msg.content.strip(),
-                            "timestamp": time.time(),
-                            "event": trigger_event
-                        })
-                        break
+            # Ask every agent at once on the shared Letta pool instead of one round-trip after another
+            loop = asyncio.get_running_loop()
+            responses = await asyncio.gather(*(
+                loop.run_in_executor(self.simulator.letta_executor, generate_banter, agent_name, agent_id)
+                for agent_name, agent_id in speakers
+            ))
+
+            # Extract trash talk
+            trash_talk = []
+            for (agent_name, _), response in zip(speakers, responses):
+                content = first_content(response)
+                if content:
+                    trash_talk.append({
+                        "agent": agent_name,
+                        "message": content,
+                        "timestamp": time.time(),
+                        "event": trigger_event
+                    })
 
             return {
                 "success": True,
@@ -1274,4 +1147,6 @@ async def main():
     print(json.dumps(progress_messages, indent=2))
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    configure_console()
+    with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+        runner.run(main())
@@ -2,11 +2,25 @@
 Configuration for Letta AI agents.
 Defines agent personalities, tools, and shared memory blocks.
 """
+import functools
 import os
 from typing import Dict, List, Any
 from dotenv import load_dotenv
 from letta_client import Letta
 
+try:
+    import httpx
+    from letta_client import AsyncLetta
+except ImportError:  # Older SDKs only ship the sync client
+    AsyncLetta = None
+
+# Connection pool for the async client: the competitive round fans out one call
+# per agent, so keep enough warm keep-alive connections to the Letta API for all of them
+ASYNC_HTTP_LIMITS = dict(max_connections=16, max_keepalive_connections=8, keepalive_expiry=30.0)
+# Per-request timeout (seconds) for both Letta clients - the SDK's own default, set explicitly so a
+# caller-supplied httpx client doesn't fall back to httpx's much shorter 5s default
+LETTA_TIMEOUT = 60.0
+
 # Load environment variables
 load_dotenv()
 
@@ -14,6 +28,8 @@ load_dotenv()
 class AgentConfig:
     """Configuration for individual agents."""
     
+    __slots__ = ("agent_id", "name", "personality", "tools")
+    
     def __init__(self, agent_id: str, name: str, personality: str, tools: List[str]):
         self.agent_id = agent_id
         self.name = name
@@ -35,17 +51,35 @@ class LettaConfig:
         
         self.client = Letta(
             token=self.api_token,
-            project="default-project"  # Use project slug instead of ID
+            project="default-project",  # Use project slug instead of ID
+            timeout=LETTA_TIMEOUT
         )
         
-        # Initialize agent configurations
-        self._setup_agent_configs()
+        # Agent configurations are built lazily on first use - most callers only need the client
     
-    def _setup_agent_configs(self):
-        """Setup configurations for all agents."""
+    def create_async_client(self):
+        """Create a native async Letta client and its httpx pool, or None if the SDK doesn't provide one.
         
-        # Shared tools for all agents
-        self.shared_tools = [
+        The caller owns the returned (client, http_client) pair and must aclose() the http_client.
+        """
+        if AsyncLetta is None:
+            return None
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(**ASYNC_HTTP_LIMITS),
+            timeout=LETTA_TIMEOUT
+        )
+        client = AsyncLetta(
+            token=self.api_token,
+            project="default-project",
+            httpx_client=http_client,
+            timeout=LETTA_TIMEOUT
+        )
+        return client, http_client
+    
+    @functools.cached_property
+    def shared_tools(self) -> List[str]:
+        """Shared tools for all agents."""
+        return [
             "write_code",
             "read_shared_context", 
             "write_shared_context",
@@ -55,9 +89,11 @@ class LettaConfig:
             "update_artifact",
             "get_agent_status"
         ]
-        
-        # Coding agents with matching frontend personalities
-        self.coding_agents = [
+    
+    @functools.cached_property
+    def coding_agents(self) -> List[AgentConfig]:
+        """Coding agents with matching frontend personalities."""
+        return [
             AgentConfig(
                 agent_id="One",
                 name="Speedrunner",
@@ -83,24 +119,33 @@ class LettaConfig:
                 tools=self.shared_tools
             )
         ]
-        
-        # Commentator agent
-        self.commentator_agent = AgentConfig(
+    
+    @functools.cached_property
+    def commentator_agent(self) -> AgentConfig:
+        """Commentator agent."""
+        return AgentConfig(
             agent_id="commentator",
             name="Project Narrator",
             personality="Observant and articulate. Provides clear, engaging commentary on development progress.",
             tools=self.shared_tools + ["observe_agents", "synthesize_update", "report_to_user"]
         )
-        
-        # All agents
-        self.all_agents = self.coding_agents + [self.commentator_agent]
+    
+    @functools.cached_property
+    def all_agents(self) -> List[AgentConfig]:
+        """All agents."""
+        return self.coding_agents + [self.commentator_agent]
+    
+    @functools.cached_property
+    def agents_by_id(self) -> Dict[str, AgentConfig]:
+        """All agents keyed by agent_id."""
+        return {agent.agent_id: agent for agent in self.all_agents}
     
     def get_agent_config(self, agent_id: str) -> AgentConfig:
         """Get configuration for a specific agent."""
-        for agent in self.all_agents:
-            if agent.agent_id == agent_id:
-                return agent
-        raise ValueError(f"Agent {agent_id} not found")
+        try:
+            return self.agents_by_id[agent_id]
+        except KeyError:
+            raise ValueError(f"Agent {agent_id} not found") from None
     
     def get_coding_agents(self) -> List[AgentConfig]:
         """Get all coding agent configurations."""
@@ -262,3 +307,9 @@ Focus on being informative and engaging in your commentary.
                 }
             }
         ]
+
+
+@functools.cache
+def get_letta_config() -> LettaConfig:
+    """Return the process-wide LettaConfig, built once on first use."""
+    return LettaConfig()
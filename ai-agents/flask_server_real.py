@@ -7,6 +7,10 @@ import sys
 import os
 import json
 import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from dotenv import load_dotenv
 load_dotenv()  # Load environment variables from .env file
 from flask import Flask, request, jsonify
@@ -16,6 +20,13 @@ from flask_cors import CORS
 sys.path.append('.')
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from src.core.event_loop import run_coroutine
+from src.core.http_session import TTS_TIMEOUT, elevenlabs_headers, get_http_session
+from src.core.letta_utils import first_content
+from src.core.logger import configure_console
+
+configure_console()
+
 try:
     from api_wrapper import CompetitiveAPI
     from src.core.agent_factory import AgentFactory
@@ -84,10 +95,32 @@ CORS(app)
 
 api_instance = CompetitiveAPI()
 
+# Small pool owned by the server for the four agent reactions, so they never queue behind
+# a running round's Letta calls (and work in simulated mode, which has no simulator)
+reaction_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="reaction")
+
 # Global transcript storage for voice commentary
+MAX_TRANSCRIPT_ENTRIES = 500  # Per-room cap; the oldest lines drop off a long-running room
 room_transcripts = {}
 room_modes = {}  # Track current mode per room (commentary/agent)
 
+def _transcript_entry(speaker, text):
+    """One transcript line; the clock is read once for both timestamp fields."""
+    now = time.time()
+    return {
+        "speaker": speaker,
+        "text": text,
+        "timestamp": now,
+        "time_formatted": time.strftime('%H:%M:%S', time.localtime(now))
+    }
+
+def _room_transcript(room_name):
+    """Bounded transcript for a room, created on first use."""
+    transcript = room_transcripts.get(room_name)
+    if transcript is None:
+        transcript = room_transcripts[room_name] = deque(maxlen=MAX_TRANSCRIPT_ENTRIES)
+    return transcript
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     return jsonify({
@@ -113,15 +146,13 @@ def get_agent_results():
         return jsonify({"success": False, "error": "Missing project_id or agent_names"}), 400
     
     # Run async function synchronously
-    import asyncio
-    results = asyncio.run(api_instance.get_results(project_id, agent_names))
+    results = run_coroutine(api_instance.get_results(project_id, agent_names))
     return jsonify(results), 200
 
 @app.route('/api/agents', methods=['GET'])
 def get_agents_info():
     # Run async function synchronously
-    import asyncio
-    agents_info = asyncio.run(api_instance.get_agents_info())
+    agents_info = run_coroutine(api_instance.get_agents_info())
     return jsonify(agents_info), 200
 
 @app.route('/api/create-agents', methods=['POST'])
@@ -130,8 +161,7 @@ def create_agents_endpoint():
     project_id = data.get('project_id', f"project_{int(time.time())}")
     
     # Use our fast simulated create_agents method instead of real Letta
-    import asyncio
-    result = asyncio.run(api_instance.create_agents(project_id))
+    result = run_coroutine(api_instance.create_agents(project_id))
     return jsonify(result), 200
 
 @app.route('/api/submit-project', methods=['POST'])
@@ -143,8 +173,7 @@ def submit_project():
         return jsonify({"success": False, "error": "Missing project_description"}), 400
     
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.submit_project(project_description))
+    result = run_coroutine(api_instance.submit_project(project_description))
     return jsonify(result), 200
 
 @app.route('/api/start-work', methods=['POST'])
@@ -157,8 +186,7 @@ def start_work():
         return jsonify({"success": False, "error": "Missing project_id or subtask_id"}), 400
     
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.start_work(project_id, subtask_id))
+    result = run_coroutine(api_instance.start_work(project_id, subtask_id))
     return jsonify(result), 200
 
 @app.route('/api/progress-messages', methods=['GET'])
@@ -169,8 +197,7 @@ def get_progress_messages():
         return jsonify({"success": False, "error": "Missing project_id"}), 400
     
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.get_progress_messages(project_id))
+    result = run_coroutine(api_instance.get_progress_messages(project_id))
     return jsonify(result), 200
 
 @app.route('/api/select-winner', methods=['POST'])
@@ -184,8 +211,7 @@ def select_winner():
         return jsonify({"success": False, "error": "Missing project_id, winner, or reason"}), 400
     
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.select_winner(project_id, winner, reason))
+    result = run_coroutine(api_instance.select_winner(project_id, winner, reason))
     return jsonify(result), 200
 
 @app.route('/api/complete-round', methods=['POST'])
@@ -206,8 +232,7 @@ def complete_round():
         return jsonify({"success": False, "error": "subtask_id must be a valid integer"}), 400
 
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.complete_round(project_id, winner, winner_code, subtask_id))
+    result = run_coroutine(api_instance.complete_round(project_id, winner, winner_code, subtask_id))
     return jsonify(result), 200
 
 @app.route('/api/agent-stats', methods=['GET'])
@@ -218,8 +243,7 @@ def get_agent_stats():
         return jsonify({"success": False, "error": "Missing project_id"}), 400
     
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.get_agent_stats(project_id))
+    result = run_coroutine(api_instance.get_agent_stats(project_id))
     return jsonify(result), 200
 
 @app.route('/api/project-status', methods=['GET'])
@@ -230,8 +254,7 @@ def get_project_status():
         return jsonify({"success": False, "error": "Missing project_id"}), 400
     
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.get_project_status(project_id))
+    result = run_coroutine(api_instance.get_project_status(project_id))
     return jsonify(result), 200
 
 @app.route('/api/retrieve-code', methods=['POST'])
@@ -244,8 +267,7 @@ def retrieve_agent_code():
         return jsonify({"success": False, "error": "Missing project_id or agent_name"}), 400
     
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.retrieve_agent_code(project_id, agent_name))
+    result = run_coroutine(api_instance.retrieve_agent_code(project_id, agent_name))
     return jsonify(result), 200
 
 @app.route('/api/get-messages', methods=['POST'])
@@ -258,8 +280,7 @@ def get_agent_messages():
         return jsonify({"success": False, "error": "Missing project_id or agent_name"}), 400
     
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.get_agent_messages(project_id, agent_name))
+    result = run_coroutine(api_instance.get_agent_messages(project_id, agent_name))
     return jsonify(result), 200
 
 @app.route('/api/get-commentary', methods=['POST'])
@@ -272,8 +293,7 @@ def get_commentary():
         return jsonify({"success": False, "error": "Missing project_id"}), 400
     
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.get_commentary(project_id, subtask_id))
+    result = run_coroutine(api_instance.get_commentary(project_id, subtask_id))
     return jsonify(result), 200
 
 @app.route('/api/get-chat-summary', methods=['POST'])
@@ -286,8 +306,7 @@ def get_chat_summary():
         return jsonify({"success": False, "error": "Missing project_id"}), 400
     
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.get_chat_summary(project_id, subtask_id))
+    result = run_coroutine(api_instance.get_chat_summary(project_id, subtask_id))
     return jsonify(result), 200
 
 @app.route('/api/orchestrate-project', methods=['POST'])
@@ -299,8 +318,7 @@ def orchestrate_project():
         return jsonify({"success": False, "error": "Missing project_description"}), 400
     
     # Run async function synchronously
-    import asyncio
-    result = asyncio.run(api_instance.orchestrate_project(project_description))
+    result = run_coroutine(api_instance.orchestrate_project(project_description))
     return jsonify(result), 200
 
 # LiveKit Voice Commentary Endpoints
@@ -322,8 +340,7 @@ def create_battle_room():
         return jsonify({"success": False, "error": "Missing project_id"}), 400
     
     # Create LiveKit room
-    import asyncio
-    result = asyncio.run(room_manager.create_battle_room(project_id))
+    result = run_coroutine(room_manager.create_battle_room(project_id))
     return jsonify(result), 200
 
 @app.route('/api/livekit/join-room', methods=['POST'])
@@ -343,8 +360,7 @@ def join_room():
         return jsonify({"success": False, "error": "Missing room_name"}), 400
     
     # Generate spectator token
-    import asyncio
-    result = asyncio.run(room_manager.generate_spectator_token(room_name, user_name))
+    result = run_coroutine(room_manager.generate_spectator_token(room_name, user_name))
     return jsonify(result), 200
 
 @app.route('/api/livekit/ask-commentator', methods=['POST'])
@@ -364,16 +380,7 @@ def ask_commentator():
         return jsonify({"success": False, "error": "Missing room_name or question"}), 400
     
     # Store user question in transcript
-    if room_name not in room_transcripts:
-        room_transcripts[room_name] = []
-    
-    # Add user question
-    room_transcripts[room_name].append({
-        "speaker": "User",
-        "text": question,
-        "timestamp": time.time(),
-        "time_formatted": time.strftime('%H:%M:%S', time.localtime())
-    })
+    _room_transcript(room_name).append(_transcript_entry("User", question))
     
     # Generate commentator response using Letta
     try:
@@ -383,7 +390,7 @@ def ask_commentator():
                 "room_name": room_name,
                 "current_time": time.strftime('%H:%M:%S', time.localtime()),
                 "user_question": question,
-                "recent_events": room_transcripts[room_name][-5:] if len(room_transcripts[room_name]) > 5 else room_transcripts[room_name]
+                "recent_events": list(islice(room_transcripts[room_name], max(0, len(room_transcripts[room_name]) - 5), None))
             }
             
             # Create commentator prompt
@@ -397,12 +404,10 @@ Give a SHORT, EXCITING response (1 sentence max). Be dramatic and fast-paced lik
             
             # Call Letta commentator agent
             from src.agents.commentator_agent import CommentatorAgent
-            from config.agents_config import LettaConfig
-            import os
+            from config.agents_config import get_letta_config
             
             # Get Letta client and commentator agent ID
-            letta_config = LettaConfig()
-            client = letta_config.client
+            client = get_letta_config().client
             commentator_agent_id = os.getenv('LETTA_AGENT_COMMENTATOR')
             
             if commentator_agent_id:
@@ -416,11 +421,7 @@ Give a SHORT, EXCITING response (1 sentence max). Be dramatic and fast-paced lik
                 )
                 
                 # Extract response content
-                response_text = "Great question! The battle is heating up!"
-                for msg in response.messages:
-                    if hasattr(msg, 'content'):
-                        response_text = msg.content.strip()
-                        break
+                response_text = first_content(response, "Great question! The battle is heating up!")
             else:
                 # Fallback if no commentator agent ID
                 response_text = f"Great question! The battle is heating up in {room_name}! Let me tell you what's happening..."
@@ -435,12 +436,7 @@ Give a SHORT, EXCITING response (1 sentence max). Be dramatic and fast-paced lik
         response_text = f"Great question! The battle is heating up in {room_name}! Let me tell you what's happening..."
     
     # Add commentator response
-    room_transcripts[room_name].append({
-        "speaker": "Commentator", 
-        "text": response_text,
-        "timestamp": time.time(),
-        "time_formatted": time.strftime('%H:%M:%S', time.localtime())
-    })
+    _room_transcript(room_name).append(_transcript_entry("Commentator", response_text))
     
     return jsonify({
         "success": True,
@@ -457,21 +453,15 @@ def get_transcript():
         return jsonify({"success": False, "error": "Missing room_name"}), 400
     
     # Get transcript for this room
-    transcript = room_transcripts.get(room_name, [])
+    transcript = _room_transcript(room_name)
     
     # If no transcript exists, add a welcome message
     if not transcript:
-        transcript = [{
-            "speaker": "System",
-            "text": f"Welcome to room {room_name}! Ask the commentator anything about the battle.",
-            "timestamp": time.time(),
-            "time_formatted": time.strftime('%H:%M:%S', time.localtime())
-        }]
-        room_transcripts[room_name] = transcript
+        transcript.append(_transcript_entry("System", f"Welcome to room {room_name}! Ask the commentator anything about the battle."))
     
     return jsonify({
         "success": True,
-        "transcript": transcript,
+        "transcript": list(transcript),
         "room_name": room_name
     }), 200
 
@@ -490,16 +480,12 @@ def get_room_status():
         return jsonify({"success": False, "error": "Missing room_name"}), 400
     
     # Get room status
-    import asyncio
-    result = asyncio.run(room_manager.get_room_status(room_name))
+    result = run_coroutine(room_manager.get_room_status(room_name))
     return jsonify(result), 200
 
 @app.route('/api/livekit/speak-text', methods=['POST'])
 def speak_text():
     """Convert text to speech using ElevenLabs"""
-    import os
-    import requests
-    
     data = request.get_json()
     text = data.get('text')
     voice_id = data.get('voice_id', 'cgSgspJ2msm6clMCkdW9')
@@ -523,12 +509,6 @@ def speak_text():
         # ElevenLabs API endpoint
         url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
         
-        headers = {
-            "Accept": "audio/mpeg",
-            "Content-Type": "application/json",
-            "xi-api-key": api_key
-        }
-        
         data = {
             "text": text,
             "model_id": "eleven_turbo_v2_5",
@@ -545,7 +525,7 @@ def speak_text():
         print(f"📝 Request data: {data}")
         print(f"🔑 Using API key: {api_key[:20]}...")
         
-        response = requests.post(url, json=data, headers=headers)
+        response = get_http_session().post(url, json=data, headers=elevenlabs_headers(api_key), timeout=TTS_TIMEOUT)
         
         print(f"📊 Response status: {response.status_code}")
         print(f"📄 Response text: {response.text[:200]}...")
@@ -561,7 +541,6 @@ def speak_text():
             
     except Exception as e:
         print(f"❌ TTS error: {e}")
-        import traceback
         traceback.print_exc()
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -608,26 +587,16 @@ def ask_agent():
             return jsonify({"success": False, "error": "agent_name must be One, Two, Three, or Four"}), 400
         
         # Store user question in transcript
-        if room_name not in room_transcripts:
-            room_transcripts[room_name] = []
-        
-        room_transcripts[room_name].append({
-            "speaker": f"User (to {agent_name})",
-            "text": question,
-            "timestamp": time.time(),
-            "time_formatted": time.strftime('%H:%M:%S', time.localtime())
-        })
+        _room_transcript(room_name).append(_transcript_entry(f"User (to {agent_name})", question))
         
         # Generate agent response using Letta
         try:
             if LETTA_AVAILABLE:
                 from src.livekit.agent_voices import get_agent_prompt_template
-                from config.agents_config import LettaConfig
-                import os
+                from config.agents_config import get_letta_config
                 
                 # Get Letta client and agent ID
-                letta_config = LettaConfig()
-                client = letta_config.client
+                client = get_letta_config().client
                 agent_env_key = f'LETTA_AGENT_{agent_name}'
                 agent_id = os.getenv(agent_env_key)
                 
@@ -643,11 +612,7 @@ def ask_agent():
                     )
                     
                     # Extract response content
-                    response_text = f"Agent {agent_name} is thinking..."
-                    for msg in response.messages:
-                        if hasattr(msg, 'content'):
-                            response_text = msg.content.strip()
-                            break
+                    response_text = first_content(response, f"Agent {agent_name} is thinking...")
                 else:
                     response_text = f"Agent {agent_name} says: 'I'm ready to code!'"
                     
@@ -659,12 +624,7 @@ def ask_agent():
             response_text = f"Agent {agent_name} says: 'Ready to battle!'"
         
         # Add agent response to transcript
-        room_transcripts[room_name].append({
-            "speaker": f"Agent {agent_name}",
-            "text": response_text,
-            "timestamp": time.time(),
-            "time_formatted": time.strftime('%H:%M:%S', time.localtime())
-        })
+        _room_transcript(room_name).append(_transcript_entry(f"Agent {agent_name}", response_text))
         
         return jsonify({
             "success": True,
@@ -696,21 +656,23 @@ def agent_reaction():
             "event_type": event_type
         }
         
-        agent_responses = []
-        
         # Import agent voices functions once at the start
         from src.livekit.agent_voices import get_agent_prompt_template, calculate_emotion_level
         
-        # Generate reactions for each agent
-        for agent_name in ['One', 'Two', 'Three', 'Four']:
+        client = None
+        if LETTA_AVAILABLE:
+            from config.agents_config import get_letta_config
+            
+            # One Letta client for all four reactions
             try:
-                if LETTA_AVAILABLE:
-                    from config.agents_config import LettaConfig
-                    import os
-                    
-                    # Get Letta client and agent ID
-                    letta_config = LettaConfig()
-                    client = letta_config.client
+                client = get_letta_config().client
+            except Exception as e:
+                print(f"❌ Letta client setup error: {e}")
+        
+        def react(agent_name):
+            try:
+                if client is not None:
+                    # Get agent ID
                     agent_env_key = f'LETTA_AGENT_{agent_name}'
                     agent_id = os.getenv(agent_env_key)
                     
@@ -726,11 +688,7 @@ def agent_reaction():
                         )
                         
                         # Extract response content
-                        response_text = f"Agent {agent_name} reacts..."
-                        for msg in response.messages:
-                            if hasattr(msg, 'content'):
-                                response_text = msg.content.strip()
-                                break
+                        response_text = first_content(response, f"Agent {agent_name} reacts...")
                     else:
                         response_text = f"Agent {agent_name}: 'Let's go!'"
                         
@@ -741,23 +699,19 @@ def agent_reaction():
                 print(f"❌ Agent {agent_name} reaction error: {e}")
                 response_text = f"Agent {agent_name}: 'Battle time!'"
             
-            agent_responses.append({
+            return {
                 "agent_name": agent_name,
                 "response_text": response_text,
                 "emotion_level": calculate_emotion_level(agent_name, battle_state)
-            })
+            }
         
-        # Add reactions to transcript
-        if room_name not in room_transcripts:
-            room_transcripts[room_name] = []
+        # Generate reactions for all agents concurrently
+        agent_responses = list(reaction_executor.map(react, ['One', 'Two', 'Three', 'Four']))
         
-        for response in agent_responses:
-            room_transcripts[room_name].append({
-                "speaker": f"Agent {response['agent_name']}",
-                "text": response['response_text'],
-                "timestamp": time.time(),
-                "time_formatted": time.strftime('%H:%M:%S', time.localtime())
-            })
+        # Add reactions to transcript
+        transcript = _room_transcript(room_name)
+        for reaction in agent_responses:
+            transcript.append(_transcript_entry(f"Agent {reaction['agent_name']}", reaction['response_text']))
         
         return jsonify({
             "success": True,
@@ -804,8 +758,7 @@ def agent_chat_direct():
             return jsonify({"success": False, "error": "Agent names must be One, Two, Three, or Four"}), 400
 
         # Run async function synchronously
-        import asyncio
-        result = asyncio.run(api_instance.agent_chat_direct(from_agent, to_agent, message, project_id))
+        result = run_coroutine(api_instance.agent_chat_direct(from_agent, to_agent, message, project_id))
         return jsonify(result), 200
 
     except Exception as e:
@@ -833,8 +786,7 @@ def agent_chat_group():
                 return jsonify({"success": False, "error": f"Invalid agent name: {agent}. Must be One, Two, Three, or Four"}), 400
 
         # Run async function synchronously
-        import asyncio
-        result = asyncio.run(api_instance.agent_chat_group(agent_names, topic, project_id))
+        result = run_coroutine(api_instance.agent_chat_group(agent_names, topic, project_id))
         return jsonify(result), 200
 
     except Exception as e:
@@ -851,8 +803,7 @@ def agent_battle_talk():
         trigger_event = data.get('trigger_event', 'battle_start')
 
         # Run async function synchronously
-        import asyncio
-        result = asyncio.run(api_instance.agent_battle_talk(project_id, battle_context, trigger_event))
+        result = run_coroutine(api_instance.agent_battle_talk(project_id, battle_context, trigger_event))
         return jsonify(result), 200
 
     except Exception as e:
@@ -5,11 +5,13 @@ Main Competitive Simulator - Competitive fullstack agent collaboration system.
 import asyncio
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 
 from config.agents_config import LettaConfig
-from src.core.agent_factory import AgentFactory
+from src.core.agent_factory import AgentFactory, AGENT_SPECS
+from src.core.event_loop import get_loop_factory
 from src.core.competitive_workflow import CompetitiveWorkflow
 from src.core.user_interaction import UserInteractionManager
 from src.core.shared_memory import SharedMemory
@@ -17,7 +19,25 @@ from src.core.message_system import MessageBroker
 from src.artifacts.artifact_manager import ArtifactManager
 from src.agents.commentator_agent import CommentatorAgent
 from src.agents.orchestrator_agent import OrchestrationAgent
-from src.core.logger import PMSimulatorLogger
+from src.core.logger import PMSimulatorLogger, configure_console
+
+# Support agents: env var with a reusable agent ID, plus memory blocks for creating a new one
+SUPPORT_AGENT_SPECS = {
+    "Commentator": {
+        "env_key": "LETTA_AGENT_COMMENTATOR",
+        "fallback_id": "commentator",
+        "persona": "I am the Commentator, a project manager who observes and narrates the competitive coding process. I analyze different approaches, explain why winners won, and provide learning insights to the team.",
+        "project": "I am observing a competitive coding project where 4 agents work on the same subtasks and compete for the best approach.",
+        "project_description": "Stores current project context and observation details"
+    },
+    "Orchestrator": {
+        "env_key": "LETTA_AGENT_ORCHESTRATOR",
+        "fallback_id": "orchestrator",
+        "persona": "I am the Orchestrator, a project manager who breaks down main tasks into subtasks and manages the competitive workflow. I analyze project requirements and create logical subtask sequences.",
+        "project": "I am managing a competitive coding project where I break down tasks into subtasks for 4 agents to work on competitively.",
+        "project_description": "Stores current project context and task breakdown details"
+    },
+}
 
 class CompetitivePMSimulator:
     """Main simulator for competitive agent collaboration."""
@@ -34,8 +54,15 @@ class CompetitivePMSimulator:
         self.logger = PMSimulatorLogger()
         self.user_interaction = UserInteractionManager()
         
+        # Dedicated pool for blocking Letta calls, one thread per coding agent,
+        # shared by the agent factory, the workflow and the simulator itself
+        self.letta_executor = ThreadPoolExecutor(
+            max_workers=len(AGENT_SPECS),
+            thread_name_prefix="letta"
+        )
+        
         # Initialize agent factory
-        self.agent_factory = AgentFactory(self.client)
+        self.agent_factory = AgentFactory(self.client, executor=self.letta_executor)
         
         # Initialize workflow
         self.workflow = CompetitiveWorkflow(
@@ -43,123 +70,85 @@ class CompetitivePMSimulator:
             self.shared_memory,
             self.message_broker,
             self.logger,
-            self.client
+            self.client,
+            letta_executor=self.letta_executor,
+            async_client_factory=self.config.create_async_client
         )
         
         self.agents = []
         self.current_project_id = None
+        
+        # Commentator/orchestrator wrappers are reused across runs
+        self.commentator = None
+        self.orchestrator = None
     
     async def _create_commentator_agent(self):
         """Reuse existing commentator agent and clear context."""
-        try:
-            # Try to reuse existing commentator agent
-            existing_id = os.getenv("LETTA_AGENT_COMMENTATOR")
-            
-            if existing_id:
-                print(f"♻️ Reusing existing Commentator agent: {existing_id}")
-                
-                # Clear context for new project
-                await self._clear_agent_context(existing_id, "competitive_project")
-                
-                return {
-                    "agent_id": existing_id,
-                    "name": "Commentator",
-                    "letta_agent": None
-                }
-            else:
-                print("⚠️ No existing Commentator agent found, creating new one...")
-                # Fallback to creating new agent
-                letta_agent = self.client.agents.create(
-                    memory_blocks=[
-                        {
-                            "label": "persona",
-                            "value": "I am the Commentator, a project manager who observes and narrates the competitive coding process. I analyze different approaches, explain why winners won, and provide learning insights to the team."
-                        },
-                        {
-                            "label": "project",
-                            "value": "I am observing a competitive coding project where 4 agents work on the same subtasks and compete for the best approach.",
-                            "description": "Stores current project context and observation details"
-                        }
-                    ],
-                    tools=["web_search", "run_code"],
-                    model="openai/gpt-4o-mini",
-                    embedding="openai/text-embedding-3-small"
-                )
-                
-                print(f"✅ Created new Commentator agent: {letta_agent.id}")
-                
-                return {
-                    "agent_id": letta_agent.id,
-                    "name": "Commentator",
-                    "letta_agent": letta_agent
-                }
-            
-        except Exception as e:
-            print(f"❌ Failed to create Commentator agent: {e}")
-            # Fallback to environment variable
-            fallback_id = os.getenv("LETTA_AGENT_COMMENTATOR", "commentator")
-            print(f"⚠️ Using fallback Commentator ID: {fallback_id}")
-            
-            return {
-                "agent_id": fallback_id,
-                "name": "Commentator",
-                "letta_agent": None
-            }
+        return await self._create_support_agent("Commentator")
     
     async def _create_orchestrator_agent(self):
         """Reuse existing orchestrator agent and clear context."""
+        return await self._create_support_agent("Orchestrator")
+    
+    async def _create_support_agent(self, name: str):
+        """Reuse an existing support agent (clearing its context) or create a new one."""
+        spec = SUPPORT_AGENT_SPECS[name]
         try:
-            # Try to reuse existing orchestrator agent
-            existing_id = os.getenv("LETTA_AGENT_ORCHESTRATOR")
+            # Try to reuse existing agent
+            existing_id = os.getenv(spec["env_key"])
             
             if existing_id:
-                print(f"♻️ Reusing existing Orchestrator agent: {existing_id}")
+                print(f"♻️ Reusing existing {name} agent: {existing_id}")
                 
                 # Clear context for new project
                 await self._clear_agent_context(existing_id, "competitive_project")
                 
                 return {
                     "agent_id": existing_id,
-                    "name": "Orchestrator",
+                    "name": name,
                     "letta_agent": None
                 }
             else:
-                print("⚠️ No existing Orchestrator agent found, creating new one...")
-                # Fallback to creating new agent
-                letta_agent = self.client.agents.create(
-                    memory_blocks=[
-                        {
-                            "label": "persona",
-                            "value": "I am the Orchestrator, a project manager who breaks down main tasks into subtasks and manages the competitive workflow. I analyze project requirements and create logical subtask sequences."
-                        },
-                        {
-                            "label": "project",
-                            "value": "I am managing a competitive coding project where I break down tasks into subtasks for 4 agents to work on competitively.",
-                            "description": "Stores current project context and task breakdown details"
-                        }
-                    ],
-                    tools=["web_search", "run_code"],
-                    model="openai/gpt-4o-mini",
-                    embedding="openai/text-embedding-3-small"
+                print(f"⚠️ No existing {name} agent found, creating new one...")
+                # Fallback to creating new agent, off the event loop on the shared Letta pool
+                loop = asyncio.get_running_loop()
+                letta_agent = await loop.run_in_executor(
+                    self.letta_executor,
+                    lambda: self.client.agents.create(
+                        memory_blocks=[
+                            {
+                                "label": "persona",
+                                "value": spec["persona"]
+                            },
+                            {
+                                "label": "project",
+                                "value": spec["project"],
+                                "description": spec["project_description"]
+                            }
+                        ],
+                        tools=["web_search", "run_code"],
+                        model="openai/gpt-4o-mini",
+                        embedding="openai/text-embedding-3-small"
+                    )
                 )
                 
-                print(f"✅ Created new Orchestrator agent: {letta_agent.id}")
+                print(f"✅ Created new {name} agent: {letta_agent.id}")
                 
                 return {
                     "agent_id": letta_agent.id,
-                    "name": "Orchestrator",
+                    "name": name,
                     "letta_agent": letta_agent
                 }
             
         except Exception as e:
-            print(f"❌ Failed to create Orchestrator agent: {e}")
+            print(f"❌ Failed to create {name} agent: {e}")
             # Fallback to environment variable
-            fallback_id = os.getenv("LETTA_AGENT_ORCHESTRATOR", "orchestrator")
-            print(f"⚠️ Using fallback Orchestrator ID: {fallback_id}")
+            fallback_id = os.getenv(spec["env_key"], spec["fallback_id"])
+            print(f"⚠️ Using fallback {name} ID: {fallback_id}")
             
             return {
                 "agent_id": fallback_id,
-                "name": "Orchestrator",
+                "name": name,
                 "letta_agent": None
             }
     
@@ -175,10 +164,14 @@ You are starting fresh on a new project. Clear your previous context and prepare
 Your personality and role remain the same, but forget any previous project details.
 """
             
-            # Send the clearing message
-            response = self.client.agents.messages.create(
-                agent_id=agent_id,
-                messages=[{"role": "user", "content": clear_message}]
+            # Send the clearing message off the event loop so setup calls can overlap
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(
+                self.letta_executor,
+                lambda: self.client.agents.messages.create(
+                    agent_id=agent_id,
+                    messages=[{"role": "user", "content": clear_message}]
+                )
             )
             
             print(f"🧹 Cleared context for agent {agent_id}")
@@ -195,27 +188,50 @@ Your personality and role remain the same, but forget any previous project detai
         print(f"{'='*60}")
         
         try:
-            # Step 1: Create commentator and orchestrator agents
-            print(f"\n🏭 Creating Commentator and Orchestrator agents...")
-            commentator_agent = await self._create_commentator_agent()
-            orchestrator_agent = await self._create_orchestrator_agent()
+            # Step 1: Set up commentator, orchestrator and coding agents concurrently
+            # (independent Letta round-trips; the rounds themselves stay sequential
+            # because each one builds on the previous winner's canonical code)
+            print(f"\n🏭 Creating Commentator, Orchestrator and fresh coding agents...")
+            setup_failed = False
+            try:
+                # A failure in any setup task cancels the others instead of leaving them running
+                async with asyncio.TaskGroup() as tg:
+                    commentator_task = tg.create_task(self._create_commentator_agent())
+                    orchestrator_task = tg.create_task(self._create_orchestrator_agent())
+                    agents_task = tg.create_task(self.agent_factory.create_fresh_agents("competitive_project"))
+            except* Exception as eg:
+                for error in eg.exceptions:
+                    print(f"❌ Agent setup failed: {error}")
+                setup_failed = True
             
-            # Initialize commentator and orchestrator
-            commentator = CommentatorAgent(
-                self.client,
-                commentator_agent["agent_id"],
-                self.logger
-            )
+            if setup_failed:
+                return
             
-            orchestrator = OrchestrationAgent(
-                self.client,
-                orchestrator_agent["agent_id"],
-                self.logger
-            )
+            commentator_agent = commentator_task.result()
+            orchestrator_agent = orchestrator_task.result()
+            self.agents = agents_task.result()
+            
+            # Initialize commentator and orchestrator once, reset them on later runs
+            if self.commentator and self.commentator.agent_id == commentator_agent["agent_id"]:
+                self.commentator.reset()
+            else:
+                self.commentator = CommentatorAgent(
+                    self.client,
+                    commentator_agent["agent_id"],
+                    self.logger,
+                    executor=self.letta_executor
+                )
+            
+            if not self.orchestrator or self.orchestrator.agent_id != orchestrator_agent["agent_id"]:
+                self.orchestrator = OrchestrationAgent(
+                    self.client,
+                    orchestrator_agent["agent_id"],
+                    self.logger
+                )
+            commentator, orchestrator = self.commentator, self.orchestrator
             
-            # Step 2: Create fresh coding agents
-            print(f"\n🏭 Creating fresh coding agents...")
-            self.agents = await self.agent_factory.create_fresh_agents("competitive_project")
+            # Start from clean per-project workflow state
+            self.workflow.reset()
             
             if not self.agents:
                 print("❌ Failed to create agents")
@@ -223,7 +239,7 @@ Your personality and role remain the same, but forget any previous project detai
             
             print(f"✅ Created {len(self.agents)} fresh agents")
             
-            # Step 3: Run competitive workflow with orchestrator
+            # Step 2: Run competitive workflow with orchestrator
             print(f"\n🎯 Starting competitive workflow...")
             self.current_project_id = await self.workflow.start_competitive_project(
                 project_description,
@@ -233,7 +249,7 @@ Your personality and role remain the same, but forget any previous project detai
                 orchestrator
             )
             
-            # Step 4: Display final results
+            # Step 3: Display final results
             await self._display_final_results()
             
             print(f"\n🎉 Competitive simulation completed!")
@@ -243,6 +259,14 @@ Your personality and role remain the same, but forget any previous project detai
             print(f"❌ Simulation error: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            # The async Letta client is bound to this run's loop, so close it before the loop goes away
+            await self.workflow.close_async_client()
+    
+    def close(self):
+        """Release the shared Letta thread pool and flush pending log records."""
+        self.letta_executor.shutdown(wait=False, cancel_futures=True)
+        self.logger.close()
     
     async def _display_final_results(self):
         """Display final results of the competitive simulation."""
@@ -263,16 +287,24 @@ async def main():
     print("🎭 Competitive Fullstack Agent PM Simulator")
     print("=" * 50)
     
-    # Get project description from user
-    project_description = input("Enter project description: ").strip()
+    # Build the simulator while the user is typing
+    simulator_task = asyncio.create_task(asyncio.to_thread(CompetitivePMSimulator))
+    
+    # Get project description from user without blocking the event loop
+    project_description = (await asyncio.to_thread(input, "Enter project description: ")).strip()
     
     if not project_description:
         project_description = "Build a modern todo application with React and TypeScript"
         print(f"Using default project: {project_description}")
     
-    # Create and run simulator
-    simulator = CompetitivePMSimulator()
-    await simulator.run_competitive_simulation(project_description)
+    # Run simulator
+    simulator = await simulator_task
+    try:
+        await simulator.run_competitive_simulation(project_description)
+    finally:
+        simulator.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    configure_console()
+    with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+        runner.run(main())
@@ -3,19 +3,204 @@ Commentator Agent - Narrates the conversation and collaboration between coding a
 """
 
 import asyncio
+import hashlib
+import re
+import string
 import time
-from typing import List, Dict, Any
-from letta_client import Letta
+from collections import OrderedDict, deque
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from src.core.letta_utils import first_content
+
+if TYPE_CHECKING:
+    from letta_client import Letta
+
+RESPONSE_CACHE_SIZE = 512  # Distinct prompts whose replies are kept for reuse
+HISTORY_SIZE = 256  # Narrations kept in conversation_history
+
+# Prompt budgets: clip the variable sections so the instructions around them always survive
+MAX_MSG_CHARS = 300
+MAX_CODE_CHARS = 400
+MAX_SECTION_CHARS = 4000
+
+# All topic keywords in one pattern, so each message is scanned once
+TOPIC_RE = re.compile(
+    r"(?P<frontend>react|frontend)"
+    r"|(?P<backend>api|backend)"
+    r"|(?P<database>database|\bdb\b)"
+    r"|(?P<ui>\bui\b|design)"
+    r"|(?P<performance>performance|optimization)",
+    re.IGNORECASE
+)
+TOPIC_NAMES = {
+    "frontend": "frontend",
+    "backend": "backend",
+    "database": "database",
+    "ui": "ui/design",
+    "performance": "performance"
+}
+
+
+# Prompt scaffolds are parsed once; each call only fills in the dynamic parts
+_CONVERSATION_PROMPT = string.Template("""
+You are a project manager commentator observing a development team conversation.
+
+Recent messages between agents:
+$messages
+
+Team members:
+$agents
+
+Analyze this conversation and provide insights about:
+1. What technical topics are being discussed
+2. What collaboration is happening
+3. Any conflicts or disagreements
+4. The overall team dynamics
+5. What progress is being made
+
+Format your analysis as a brief, engaging commentary (2-3 sentences max).
+Be conversational and insightful, like a real PM observing the team.
+""")
+
+_SUMMARY_PROMPT = string.Template("""
+You are a project manager providing a final project summary.
+
+Project Status:
+- Total subtasks: $total_subtasks
+- Completed: $completed_subtasks
+- Progress: $progress%
+
+Team Performance:
+$agent_stats
+
+Provide a brief, professional summary of the project completion and team performance.
+Be encouraging but honest about the results.
+""")
+
+_WORK_ANALYSIS_PROMPT = string.Template("""
+You are a senior project manager analyzing different technical approaches to a subtask.
+
+Subtask: $title
+Description: $description
+
+Agent Approaches:
+$approaches
+
+Analyze these approaches and provide insights about:
+1. The different technical strategies and patterns used by each agent
+2. Code quality, structure, and best practices in each approach
+3. Which approaches show the most promise and why
+4. Technical diversity and innovation in the team
+5. Areas for improvement and potential issues
+
+Format as a detailed technical analysis (3-4 sentences).
+Be specific about React patterns, code structure, and technical decisions.
+Avoid generic responses - analyze the actual code provided.
+""")
+
+_WINNER_PROMPT = string.Template("""
+You are a project manager analyzing why a specific approach won in a competitive round.
+
+Winner: $winner
+Winner's approach: $code_summary
+
+All approaches:
+$approaches
+
+Analyze why this approach won and provide insights about:
+1. What made this approach stand out
+2. Technical strengths that led to victory
+3. What other agents can learn from this
+4. Key factors that influenced the decision
+
+Format as a brief, constructive analysis (2-3 sentences).
+Be specific about technical merits and learning opportunities.
+""")
+
+_LEARNING_PROMPT = string.Template("""
+You are a project manager providing learning insights to the development team.
+
+Round $round_num Winner: $winner
+Why they won: $analysis
+
+Create a learning summary that:
+1. Celebrates the winner's success
+2. Explains the key factors that led to victory
+3. Provides actionable insights for all team members
+4. Encourages continued learning and improvement
+5. Maintains team morale and motivation
+
+Format as an encouraging, educational message (3-4 sentences).
+Be positive but honest about what can be learned.
+""")
+
+
+def _clip(text: str, limit: int) -> str:
+    """Truncate text to limit characters, marking the cut."""
+    return text if len(text) <= limit else text[:limit] + "..."
 
 class CommentatorAgent:
     """Narrates the conversation and collaboration happening between agents."""
     
-    def __init__(self, client: Letta, agent_id: str, logger):
+    def __init__(self, client: "Letta", agent_id: str, logger, executor: Optional[Executor] = None):
         self.client = client
         self.agent_id = agent_id
         self.logger = logger
-        self.conversation_history = []
+        self.executor = executor  # Shared pool for blocking Letta calls
+        self.conversation_history = deque(maxlen=HISTORY_SIZE)
         self.project_context = {}
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()  # sha256(prompt) -> reply, LRU order
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+    
+    def reset(self):
+        """Clear per-project observations so the commentator can be reused."""
+        self.conversation_history.clear()
+        self.project_context.clear()
+        # Replies are keyed by prompt alone, so they must not outlive the project
+        self._response_cache.clear()
+        self._inflight.clear()
+    
+    async def _ask(self, prompt: str) -> str:
+        """Send a prompt to the commentator agent, reusing the reply for an identical prompt."""
+        key = hashlib.sha256(prompt.encode()).hexdigest()
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            return cached
+        
+        # Concurrent narrations asking the same thing share one in-flight Letta call
+        request = self._inflight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(self._request(key, prompt))
+            self._inflight[key] = request
+            request.add_done_callback(lambda done: self._forget_request(key, done))
+        return await asyncio.shield(request)
+    
+    def _forget_request(self, key: str, request: "asyncio.Future[str]"):
+        """Drop a finished request, unless reset() already replaced it with a newer one."""
+        if self._inflight.get(key) is request:
+            del self._inflight[key]
+    
+    async def _request(self, key: str, prompt: str) -> str:
+        """Make the Letta call for a prompt and cache a non-empty reply."""
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            self.executor,
+            lambda: self.client.agents.messages.create(
+                agent_id=self.agent_id,
+                messages=[{"role": "user", "content": prompt}]
+            )
+        )
+        
+        reply = first_content(response)
+        
+        # Only cache real replies so a blank answer gets retried next time,
+        # and drop replies to requests that a reset() orphaned mid-flight
+        if reply and self._inflight.get(key) is asyncio.current_task():
+            self._response_cache[key] = reply
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return reply
         
     async def narrate_conversation(self, agents: List[Any], message_broker, shared_memory):
         """Narrate the ongoing conversation between agents."""
@@ -43,42 +228,13 @@ class CommentatorAgent:
     
     async def _analyze_conversation(self, messages: List[Any], agents: List[Any]) -> Dict[str, Any]:
         """Analyze the conversation to understand what's happening."""
-        analysis_prompt = f"""
-You are a project manager commentator observing a development team conversation.
-
-Recent messages between agents:
-{self._format_messages_for_analysis(messages)}
-
-Team members:
-{self._format_agents_for_analysis(agents)}
-
-Analyze this conversation and provide insights about:
-1. What technical topics are being discussed
-2. What collaboration is happening
-3. Any conflicts or disagreements
-4. The overall team dynamics
-5. What progress is being made
-
-Format your analysis as a brief, engaging commentary (2-3 sentences max).
-Be conversational and insightful, like a real PM observing the team.
-"""
+        analysis_prompt = _CONVERSATION_PROMPT.substitute(
+            messages=self._format_messages_for_analysis(messages),
+            agents=self._format_agents_for_analysis(agents)
+        )
         
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.agents.messages.create(
-                    agent_id=self.agent_id,
-                    messages=[{"role": "user", "content": analysis_prompt}]
-                )
-            )
-            
-            # Extract analysis from response
-            analysis = ""
-            for msg in response.messages:
-                if hasattr(msg, 'content'):
-                    analysis = msg.content.strip()
-                    break
+            analysis = await self._ask(analysis_prompt)
             
             if not analysis:
                 analysis = "The team is actively collaborating on the project."
@@ -101,33 +257,23 @@ Be conversational and insightful, like a real PM observing the team.
     
     def _format_messages_for_analysis(self, messages: List[Any]) -> str:
         """Format messages for analysis."""
-        formatted = []
-        for msg in messages:
-            formatted.append(f"{msg.from_agent}: {msg.content}")
-        return "\n".join(formatted)
+        return _clip(
+            "\n".join([f"{msg.from_agent}: {_clip(msg.content, MAX_MSG_CHARS)}" for msg in messages]),
+            MAX_SECTION_CHARS
+        )
     
     def _format_agents_for_analysis(self, agents: List[Any]) -> str:
         """Format agent info for analysis."""
-        formatted = []
-        for agent in agents:
-            formatted.append(f"- {agent.name}: {agent.personality}")
-        return "\n".join(formatted)
+        return "\n".join([f"- {agent.name}: {agent.personality}" for agent in agents])
     
     def _extract_topics(self, messages: List[Any]) -> List[str]:
         """Extract technical topics from messages."""
+        # One scan over the whole window, stopping once every topic has been seen
         topics = set()
-        for msg in messages:
-            content = msg.content.lower()
-            if "react" in content or "frontend" in content:
-                topics.add("frontend")
-            if "api" in content or "backend" in content:
-                topics.add("backend")
-            if "database" in content or "db" in content:
-                topics.add("database")
-            if "ui" in content or "design" in content:
-                topics.add("ui/design")
-            if "performance" in content or "optimization" in content:
-                topics.add("performance")
+        for match in TOPIC_RE.finditer("\n".join([msg.content for msg in messages])):
+            topics.add(TOPIC_NAMES[match.lastgroup])
+            if len(topics) == len(TOPIC_NAMES):
+                break
         return list(topics)
     
     def _assess_collaboration(self, messages: List[Any]) -> str:
@@ -141,17 +287,20 @@ Be conversational and insightful, like a real PM observing the team.
     
     async def _narrate_activity(self, summary: Dict[str, Any], agents: List[Any]):
         """Narrate the current activity."""
-        print(f"\n🎙️ COMMENTATOR: {summary['analysis']}")
+        # Collect the narration and emit it in one write so concurrent output can't split it
+        lines = [f"\n🎙️ COMMENTATOR: {summary['analysis']}"]
         
         if summary['topics']:
-            print(f"🎙️ COMMENTATOR: I can see they're discussing: {', '.join(summary['topics'])}")
+            lines.append(f"🎙️ COMMENTATOR: I can see they're discussing: {', '.join(summary['topics'])}")
         
         if summary['collaboration_level'] == "high":
-            print(f"🎙️ COMMENTATOR: Great collaboration happening! {summary['message_count']} messages exchanged.")
+            lines.append(f"🎙️ COMMENTATOR: Great collaboration happening! {summary['message_count']} messages exchanged.")
         elif summary['collaboration_level'] == "moderate":
-            print(f"🎙️ COMMENTATOR: Good team communication with {summary['message_count']} messages.")
+            lines.append(f"🎙️ COMMENTATOR: Good team communication with {summary['message_count']} messages.")
         else:
-            print(f"🎙️ COMMENTATOR: Team is just getting started with {summary['message_count']} messages.")
+            lines.append(f"🎙️ COMMENTATOR: Team is just getting started with {summary['message_count']} messages.")
+        
+        print("\n".join(lines))
     
     async def provide_project_summary(self, orchestrator, agents: List[Any]):
         """Provide a summary of the entire project."""
@@ -160,48 +309,27 @@ Be conversational and insightful, like a real PM observing the team.
         # Get project status
         status = orchestrator.get_project_status()
         
-        # Get agent stats
-        agent_stats = []
-        for agent in agents:
-            agent_status = await agent.get_status()
-            agent_stats.append({
+        # Get agent stats (all agents queried concurrently)
+        statuses = await asyncio.gather(*(agent.get_status() for agent in agents))
+        agent_stats = [
+            {
                 "name": agent_status['name'],
                 "messages": agent_status['messages_sent'],
                 "working": agent_status['is_working']
-            })
+            }
+            for agent_status in statuses
+        ]
         
         # Generate summary
-        summary_prompt = f"""
-You are a project manager providing a final project summary.
-
-Project Status:
-- Total subtasks: {status['total_subtasks']}
-- Completed: {status['completed_subtasks']}
-- Progress: {status['progress_percentage']:.1f}%
-
-Team Performance:
-{self._format_agent_stats(agent_stats)}
-
-Provide a brief, professional summary of the project completion and team performance.
-Be encouraging but honest about the results.
-"""
+        summary_prompt = _SUMMARY_PROMPT.substitute(
+            total_subtasks=status['total_subtasks'],
+            completed_subtasks=status['completed_subtasks'],
+            progress=f"{status['progress_percentage']:.1f}",
+            agent_stats=self._format_agent_stats(agent_stats)
+        )
         
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.agents.messages.create(
-                    agent_id=self.agent_id,
-                    messages=[{"role": "user", "content": summary_prompt}]
-                )
-            )
-            
-            # Extract summary from response
-            summary = ""
-            for msg in response.messages:
-                if hasattr(msg, 'content'):
-                    summary = msg.content.strip()
-                    break
+            summary = await self._ask(summary_prompt)
             
             if not summary:
                 summary = f"Project completed with {status['progress_percentage']:.1f}% progress."
@@ -214,11 +342,10 @@ Be encouraging but honest about the results.
     
     def _format_agent_stats(self, agent_stats: List[Dict]) -> str:
         """Format agent statistics for summary."""
-        formatted = []
-        for stats in agent_stats:
-            status = "working" if stats['working'] else "idle"
-            formatted.append(f"- {stats['name']}: {stats['messages']} messages, {status}")
-        return "\n".join(formatted)
+        return "\n".join([
+            f"- {stats['name']}: {stats['messages']} messages, {'working' if stats['working'] else 'idle'}"
+            for stats in agent_stats
+        ])
     
     async def narrate_agent_work(self, agents: List[Any], work_results: List[Any], subtask: Any):
         """Narrate agent work during competitive rounds."""
@@ -234,43 +361,14 @@ Be encouraging but honest about the results.
     
     async def _analyze_work_approaches(self, work_results: List[Any], subtask: Any) -> Dict[str, Any]:
         """Analyze the different work approaches."""
-        analysis_prompt = f"""
-You are a senior project manager analyzing different technical approaches to a subtask.
-
-Subtask: {subtask.title}
-Description: {subtask.description}
-
-Agent Approaches:
-{self._format_work_results(work_results)}
-
-Analyze these approaches and provide insights about:
-1. The different technical strategies and patterns used by each agent
-2. Code quality, structure, and best practices in each approach
-3. Which approaches show the most promise and why
-4. Technical diversity and innovation in the team
-5. Areas for improvement and potential issues
-
-Format as a detailed technical analysis (3-4 sentences).
-Be specific about React patterns, code structure, and technical decisions.
-Avoid generic responses - analyze the actual code provided.
-"""
+        analysis_prompt = _WORK_ANALYSIS_PROMPT.substitute(
+            title=subtask.title,
+            description=subtask.description,
+            approaches=self._format_work_results(work_results)
+        )
         
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.agents.messages.create(
-                    agent_id=self.agent_id,
-                    messages=[{"role": "user", "content": analysis_prompt}]
-                )
-            )
-            
-            # Extract analysis from response
-            analysis = ""
-            for msg in response.messages:
-                if hasattr(msg, 'content'):
-                    analysis = msg.content.strip()
-                    break
+            analysis = await self._ask(analysis_prompt)
             
             if not analysis:
                 analysis = f"Interesting variety of approaches to {subtask.title} from the team."
@@ -293,12 +391,11 @@ Avoid generic responses - analyze the actual code provided.
     
     def _format_work_results(self, work_results: List[Any]) -> str:
         """Format work results for analysis."""
-        formatted = []
-        for result in work_results:
-            # Get the actual code, not just metadata
-            code_preview = result.code[:500] + "..." if len(result.code) > 500 else result.code
-            formatted.append(f"- {result.agent_name}: {code_preview}")
-        return "\n".join(formatted)
+        # Get the actual code, not just metadata
+        return _clip(
+            "\n".join([f"- {result.agent_name}: {_clip(result.code, MAX_CODE_CHARS)}" for result in work_results]),
+            MAX_SECTION_CHARS
+        )
     
     def _assess_technical_diversity(self, work_results: List[Any]) -> str:
         """Assess technical diversity of approaches."""
@@ -311,7 +408,7 @@ Avoid generic responses - analyze the actual code provided.
     
     def _assess_code_quality(self, work_results: List[Any]) -> str:
         """Assess overall code quality."""
-        total_lines = sum(len(result.code.split('\n')) for result in work_results)
+        total_lines = sum(result.code.count('\n') + 1 for result in work_results)
         avg_lines = total_lines / len(work_results) if work_results else 0
         
         if avg_lines > 50:
@@ -325,59 +422,34 @@ Avoid generic responses - analyze the actual code provided.
     
     async def _narrate_work_approaches(self, analysis: Dict[str, Any], work_results: List[Any]):
         """Narrate the work approaches."""
-        print(f"🎙️ COMMENTATOR: {analysis['analysis']}")
+        lines = [f"🎙️ COMMENTATOR: {analysis['analysis']}"]
         
         if analysis['technical_diversity'] == "high":
-            print(f"🎙️ COMMENTATOR: Excellent technical diversity! {analysis['approaches_count']} unique approaches.")
+            lines.append(f"🎙️ COMMENTATOR: Excellent technical diversity! {analysis['approaches_count']} unique approaches.")
         elif analysis['technical_diversity'] == "moderate":
-            print(f"🎙️ COMMENTATOR: Good variety of approaches with {analysis['approaches_count']} submissions.")
+            lines.append(f"🎙️ COMMENTATOR: Good variety of approaches with {analysis['approaches_count']} submissions.")
         else:
-            print(f"🎙️ COMMENTATOR: {analysis['approaches_count']} approaches submitted.")
+            lines.append(f"🎙️ COMMENTATOR: {analysis['approaches_count']} approaches submitted.")
         
         if analysis['quality_level'] == "excellent":
-            print(f"🎙️ COMMENTATOR: High-quality code submissions from the team!")
+            lines.append(f"🎙️ COMMENTATOR: High-quality code submissions from the team!")
         elif analysis['quality_level'] == "good":
-            print(f"🎙️ COMMENTATOR: Solid code quality across all submissions.")
+            lines.append(f"🎙️ COMMENTATOR: Solid code quality across all submissions.")
         else:
-            print(f"🎙️ COMMENTATOR: Basic implementations, but good effort from the team.")
+            lines.append(f"🎙️ COMMENTATOR: Basic implementations, but good effort from the team.")
+        
+        print("\n".join(lines))
     
     async def analyze_winner(self, winner: Any, all_results: List[Any]) -> str:
         """Analyze why the winner won."""
-        analysis_prompt = f"""
-You are a project manager analyzing why a specific approach won in a competitive round.
-
-Winner: {winner.agent_name}
-Winner's approach: {winner.metadata.get('code_summary', 'No summary')}
-
-All approaches:
-{self._format_work_results(all_results)}
-
-Analyze why this approach won and provide insights about:
-1. What made this approach stand out
-2. Technical strengths that led to victory
-3. What other agents can learn from this
-4. Key factors that influenced the decision
-
-Format as a brief, constructive analysis (2-3 sentences).
-Be specific about technical merits and learning opportunities.
-"""
+        analysis_prompt = _WINNER_PROMPT.substitute(
+            winner=winner.agent_name,
+            code_summary=winner.metadata.get('code_summary', 'No summary'),
+            approaches=self._format_work_results(all_results)
+        )
         
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.agents.messages.create(
-                    agent_id=self.agent_id,
-                    messages=[{"role": "user", "content": analysis_prompt}]
-                )
-            )
-            
-            # Extract analysis from response
-            analysis = ""
-            for msg in response.messages:
-                if hasattr(msg, 'content'):
-                    analysis = msg.content.strip()
-                    break
+            analysis = await self._ask(analysis_prompt)
             
             if not analysis:
                 analysis = f"{winner.agent_name}'s approach showed strong technical execution and clear implementation."
@@ -390,39 +462,14 @@ Be specific about technical merits and learning opportunities.
     
     async def provide_learning_summary(self, winner: Any, analysis: str, round_num: int) -> str:
         """Provide learning summary for all agents."""
-        learning_prompt = f"""
-You are a project manager providing learning insights to the development team.
-
-Round {round_num} Winner: {winner.agent_name}
-Why they won: {analysis}
-
-Create a learning summary that:
-1. Celebrates the winner's success
-2. Explains the key factors that led to victory
-3. Provides actionable insights for all team members
-4. Encourages continued learning and improvement
-5. Maintains team morale and motivation
-
-Format as an encouraging, educational message (3-4 sentences).
-Be positive but honest about what can be learned.
-"""
+        learning_prompt = _LEARNING_PROMPT.substitute(
+            round_num=round_num,
+            winner=winner.agent_name,
+            analysis=analysis
+        )
         
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.agents.messages.create(
-                    agent_id=self.agent_id,
-                    messages=[{"role": "user", "content": learning_prompt}]
-                )
-            )
-            
-            # Extract learning summary from response
-            learning = ""
-            for msg in response.messages:
-                if hasattr(msg, 'content'):
-                    learning = msg.content.strip()
-                    break
+            learning = await self._ask(learning_prompt)
             
             if not learning:
                 learning = f"Congratulations to {winner.agent_name} for winning Round {round_num}! Their approach demonstrated excellent technical execution. All team members can learn from this success and continue improving their skills."
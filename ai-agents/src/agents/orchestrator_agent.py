@@ -5,11 +5,14 @@ Orchestrator Agent - Breaks down main tasks into subtasks for competitive workfl
 import asyncio
 import json
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
 from dataclasses import dataclass
-from letta_client import Letta
+from src.core.letta_utils import first_content, loads_content
 
-@dataclass
+if TYPE_CHECKING:
+    from letta_client import Letta
+
+@dataclass(slots=True)
 class Subtask:
     """Represents a subtask for competitive work."""
     id: str
@@ -21,12 +24,13 @@ class Subtask:
 class OrchestrationAgent:
     """Orchestrator agent that breaks down tasks into subtasks."""
     
-    def __init__(self, client: Letta, agent_id: str, logger):
+    def __init__(self, client: "Letta", agent_id: str, logger):
         self.client = client
         self.agent_id = agent_id
         self.logger = logger
         self.name = "Orchestrator"
         self.subtasks = []
+        self._subtasks_by_id = {}
         self.project_status = {
             "total_subtasks": 0,
             "completed_subtasks": 0,
@@ -41,25 +45,10 @@ class OrchestrationAgent:
             # Use Letta API to intelligently break down the project
             subtasks_data = await self._letta_orchestrate_project(main_task)
             
-            # Convert to Subtask objects
-            self.subtasks = []
-            for i, subtask_data in enumerate(subtasks_data, 1):
-                subtask = Subtask(
-                    id=f"subtask_{i}",
-                    title=subtask_data["title"],
-                    description=subtask_data["description"],
-                    round_num=i
-                )
-                self.subtasks.append(subtask)
-            
-            # Update project status
-            self.project_status["total_subtasks"] = len(self.subtasks)
-            self.project_status["completed_subtasks"] = 0
-            self.project_status["progress_percentage"] = 0.0
+            self._set_subtasks(subtasks_data)
             
             print(f"✅ ORCHESTRATOR: Created {len(self.subtasks)} subtasks:")
-            for subtask in self.subtasks:
-                print(f"  • {subtask.title}: {subtask.description}")
+            print("\n".join(f"  • {subtask.title}: {subtask.description}" for subtask in self.subtasks))
             
             return self.subtasks
             
@@ -70,27 +59,31 @@ class OrchestrationAgent:
             # Fallback to default subtasks
             subtasks_data = self._create_subtasks_for_project(main_task)
             
-            # Convert to Subtask objects
-            self.subtasks = []
-            for i, subtask_data in enumerate(subtasks_data, 1):
-                subtask = Subtask(
-                    id=f"subtask_{i}",
-                    title=subtask_data["title"],
-                    description=subtask_data["description"],
-                    round_num=i
-                )
-                self.subtasks.append(subtask)
-            
-            self.project_status["total_subtasks"] = len(self.subtasks)
-            self.project_status["completed_subtasks"] = 0
-            self.project_status["progress_percentage"] = 0.0
+            self._set_subtasks(subtasks_data)
             
             print(f"✅ ORCHESTRATOR: Created {len(self.subtasks)} fallback subtasks")
-            for i, subtask in enumerate(self.subtasks, 1):
-                print(f"  {i}. {subtask.title}")
+            print("\n".join(f"  {i}. {subtask.title}" for i, subtask in enumerate(self.subtasks, 1)))
             
             return self.subtasks
     
+    def _set_subtasks(self, subtasks_data: List[Dict[str, Any]]) -> List[Subtask]:
+        """Convert subtask dicts to Subtask objects and reset project status."""
+        self.subtasks = [
+            Subtask(
+                id=f"subtask_{i}",
+                title=subtask_data["title"],
+                description=subtask_data["description"],
+                round_num=i
+            )
+            for i, subtask_data in enumerate(subtasks_data, 1)
+        ]
+        self._subtasks_by_id = {subtask.id: subtask for subtask in self.subtasks}
+        
+        self.project_status["total_subtasks"] = len(self.subtasks)
+        self.project_status["completed_subtasks"] = 0
+        self.project_status["progress_percentage"] = 0.0
+        return self.subtasks
+    
     async def _letta_orchestrate_project(self, main_task: str) -> List[Dict[str, Any]]:
         """Use Letta AI to intelligently break down a project into subtasks."""
         orchestration_prompt = f"""
@@ -135,17 +128,13 @@ Return ONLY the JSON array, no other text.
             )
             
             # Extract response content
-            response_text = ""
-            for msg in response.messages:
-                if hasattr(msg, 'content'):
-                    response_text = msg.content.strip()
-                    break
+            response_text = first_content(response)
             
             if not response_text:
                 raise Exception("Empty response from Letta API")
             
             # Parse JSON response
-            subtasks_data = json.loads(response_text)
+            subtasks_data = loads_content(response_text)
             
             # Validate structure
             if not isinstance(subtasks_data, list):
@@ -268,16 +257,17 @@ Return ONLY the JSON array, no other text.
     
     def mark_subtask_completed(self, subtask_id: str):
         """Mark a subtask as completed."""
-        for subtask in self.subtasks:
-            if subtask.id == subtask_id:
-                subtask.status = "completed"
-                self.project_status["completed_subtasks"] += 1
-                self.project_status["progress_percentage"] = (
-                    self.project_status["completed_subtasks"] / 
-                    self.project_status["total_subtasks"] * 100
-                )
-                print(f"✅ Orchestrator: Completed {subtask.title}")
-                break
+        subtask = self._subtasks_by_id.get(subtask_id)
+        if subtask is None or subtask.status == "completed":
+            return
+        
+        subtask.status = "completed"
+        self.project_status["completed_subtasks"] += 1
+        self.project_status["progress_percentage"] = (
+            self.project_status["completed_subtasks"] / 
+            self.project_status["total_subtasks"] * 100
+        )
+        print(f"✅ Orchestrator: Completed {subtask.title}")
     
     def get_project_status(self) -> Dict[str, Any]:
         """Get current project status."""
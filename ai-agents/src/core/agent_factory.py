@@ -2,13 +2,17 @@
 Agent Factory - Creates fresh Letta agent instances for each new project.
 """
 
+import asyncio
 import os
 import uuid
-from typing import List, Dict, Any
-from letta_client import Letta
+from concurrent.futures import Executor
+from typing import List, Dict, Any, NamedTuple, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
-@dataclass
+if TYPE_CHECKING:
+    from letta_client import Letta
+
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for a fresh agent."""
     agent_id: str
@@ -17,88 +21,101 @@ class AgentConfig:
     coding_style: str
     description: str
 
+class AgentSpec(NamedTuple):
+    """Static definition of a coding agent and the env var holding its Letta ID."""
+    name: str
+    env_key: str
+    personality: str
+    coding_style: str
+    description: str
+
+AGENT_SPECS = (
+    AgentSpec(
+        name="One",
+        env_key="LETTA_AGENT_ONE",
+        personality="Sarcastic, funny, loves memes, writes clean code with humor in comments",
+        coding_style="Uses emojis in comments, writes clean functions, loves TypeScript, always includes error handling",
+        description="Fullstack developer who brings humor and sarcasm to code while maintaining high quality"
+    ),
+    AgentSpec(
+        name="Two",
+        env_key="LETTA_AGENT_TWO",
+        personality="Technical perfectionist, loves documentation, over-engineers everything, very methodical",
+        coding_style="Extensive documentation, type safety everywhere, comprehensive error handling, follows all best practices",
+        description="Fullstack developer obsessed with type safety, documentation, and enterprise-grade code"
+    ),
+    AgentSpec(
+        name="Three",
+        env_key="LETTA_AGENT_THREE",
+        personality="Fast-paced, aggressive, loves performance, ships quickly, competitive",
+        coding_style="Optimized code, minimal comments, focuses on performance, uses latest frameworks",
+        description="Fullstack developer who prioritizes speed and performance in everything they build"
+    ),
+    AgentSpec(
+        name="Four",
+        env_key="LETTA_AGENT_FOUR",
+        personality="Creative, design-focused, loves beautiful UI, user-centric, artistic",
+        coding_style="Beautiful, readable code, focuses on UX, loves CSS/design systems, clean architecture",
+        description="Fullstack developer who creates beautiful, user-focused applications with artistic flair"
+    ),
+)
+
 class AgentFactory:
     """Factory for creating fresh Letta agent instances."""
     
-    def __init__(self, client: Letta):
+    def __init__(self, client: "Letta", executor: Optional[Executor] = None):
         self.client = client
-        self.agent_configs = [
-            {
-                "name": "One",
-                "personality": "Sarcastic, funny, loves memes, writes clean code with humor in comments",
-                "coding_style": "Uses emojis in comments, writes clean functions, loves TypeScript, always includes error handling",
-                "description": "Fullstack developer who brings humor and sarcasm to code while maintaining high quality"
-            },
-            {
-                "name": "Two",
-                "personality": "Technical perfectionist, loves documentation, over-engineers everything, very methodical",
-                "coding_style": "Extensive documentation, type safety everywhere, comprehensive error handling, follows all best practices",
-                "description": "Fullstack developer obsessed with type safety, documentation, and enterprise-grade code"
-            },
-            {
-                "name": "Three",
-                "personality": "Fast-paced, aggressive, loves performance, ships quickly, competitive",
-                "coding_style": "Optimized code, minimal comments, focuses on performance, uses latest frameworks",
-                "description": "Fullstack developer who prioritizes speed and performance in everything they build"
-            },
-            {
-                "name": "Four",
-                "personality": "Creative, design-focused, loves beautiful UI, user-centric, artistic",
-                "coding_style": "Beautiful, readable code, focuses on UX, loves CSS/design systems, clean architecture",
-                "description": "Fullstack developer who creates beautiful, user-focused applications with artistic flair"
-            }
-        ]
+        self.executor = executor  # Shared pool for blocking Letta calls
+        self.agent_configs = AGENT_SPECS
+        # Resolve the reusable Letta agent IDs once per factory
+        self._agent_ids = {spec.name: os.environ.get(spec.env_key) for spec in AGENT_SPECS}
     
     async def create_fresh_agents(self, project_id: str) -> List[Dict[str, Any]]:
         """Reuse existing agents and clear their context for a new project."""
         print(f"🏭 Reusing existing agents for project: {project_id}")
         
-        agents = []
-        
-        for config in self.agent_configs:
-            # Try to reuse existing agent from environment variables
-            existing_agent_id = self._get_existing_agent_id(config["name"])
-            
+        # Resolve which specs have an existing agent, then clear all their contexts concurrently
+        reusable = []
+        for spec in self.agent_configs:
+            existing_agent_id = self._get_existing_agent_id(spec.name)
             if existing_agent_id:
-                print(f"♻️ Reusing existing agent: {config['name']} ({existing_agent_id})")
-                
-                # Clear agent context for new project
-                await self._clear_agent_context(existing_agent_id, project_id)
-                
-                agent_config = AgentConfig(
-                    agent_id=existing_agent_id,
-                    name=config["name"],
-                    personality=config["personality"],
-                    coding_style=config["coding_style"],
-                    description=config["description"]
-                )
-                
-                agents.append({
-                    "config": agent_config,
-                    "letta_agent": {
-                        "agent_id": existing_agent_id,
-                        "name": config["name"],
-                        "fresh_context": True  # Context was cleared
-                    }
-                })
-                
-                print(f"✅ Reused agent: {config['name']} ({existing_agent_id})")
+                print(f"♻️ Reusing existing agent: {spec.name} ({existing_agent_id})")
+                reusable.append((spec, existing_agent_id))
             else:
-                print(f"⚠️ No existing agent found for {config['name']}, skipping...")
-                continue
+                print(f"⚠️ No existing agent found for {spec.name}, skipping...")
+        
+        await asyncio.gather(*(
+            self._clear_agent_context(existing_agent_id, project_id)
+            for _, existing_agent_id in reusable
+        ))
+        
+        agents = []
+        for spec, existing_agent_id in reusable:
+            agent_config = AgentConfig(
+                agent_id=existing_agent_id,
+                name=spec.name,
+                personality=spec.personality,
+                coding_style=spec.coding_style,
+                description=spec.description
+            )
+            
+            agents.append({
+                "config": agent_config,
+                "letta_agent": {
+                    "agent_id": existing_agent_id,
+                    "name": spec.name,
+                    "fresh_context": True  # Context was cleared
+                }
+            })
+            
+            print(f"✅ Reused agent: {spec.name} ({existing_agent_id})")
         
         print(f"🎉 Reused {len(agents)} agents for project {project_id}")
         return agents
     
     def _get_existing_agent_id(self, agent_name: str) -> str:
         """Get existing agent ID from environment variables."""
-        agent_id_mapping = {
-            "One": os.getenv("LETTA_AGENT_ONE"),
-            "Two": os.getenv("LETTA_AGENT_TWO"),
-            "Three": os.getenv("LETTA_AGENT_THREE"),
-            "Four": os.getenv("LETTA_AGENT_FOUR")
-        }
-        return agent_id_mapping.get(agent_name)
+        return self._agent_ids.get(agent_name)
     
     async def _clear_agent_context(self, agent_id: str, project_id: str):
         """Clear agent context for new project."""
@@ -112,10 +129,14 @@ You are starting fresh on a new project. Clear your previous context and prepare
 Your personality and coding style remain the same, but forget any previous project details.
 """
             
-            # Send the clearing message
-            response = self.client.agents.messages.create(
-                agent_id=agent_id,
-                messages=[{"role": "user", "content": clear_message}]
+            # Send the clearing message on the shared Letta pool
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(
+                self.executor,
+                lambda: self.client.agents.messages.create(
+                    agent_id=agent_id,
+                    messages=[{"role": "user", "content": clear_message}]
+                )
             )
             
             print(f"🧹 Cleared context for agent {agent_id}")
@@ -127,22 +148,26 @@ Your personality and coding style remain the same, but forget any previous proje
     async def _create_letta_agent(self, agent_id: str, name: str, description: str):
         """Create a fresh Letta agent instance."""
         try:
-            # Create a fresh Letta agent with proper memory blocks
-            letta_agent = self.client.agents.create(
-                memory_blocks=[
-                    {
-                        "label": "persona",
-                        "value": f"I am {name}, a fullstack developer. {description}"
-                    },
-                    {
-                        "label": "project",
-                        "value": "I am working on a competitive coding project with other agents.",
-                        "description": "Stores current project context and requirements"
-                    }
-                ],
-                tools=["web_search", "run_code"],
-                model="openai/gpt-4o-mini",
-                embedding="openai/text-embedding-3-small"
+            # Create a fresh Letta agent with proper memory blocks, off the event loop
+            loop = asyncio.get_running_loop()
+            letta_agent = await loop.run_in_executor(
+                self.executor,
+                lambda: self.client.agents.create(
+                    memory_blocks=[
+                        {
+                            "label": "persona",
+                            "value": f"I am {name}, a fullstack developer. {description}"
+                        },
+                        {
+                            "label": "project",
+                            "value": "I am working on a competitive coding project with other agents.",
+                            "description": "Stores current project context and requirements"
+                        }
+                    ],
+                    tools=["web_search", "run_code"],
+                    model="openai/gpt-4o-mini",
+                    embedding="openai/text-embedding-3-small"
+                )
             )
             
             print(f"✅ Created fresh Letta agent: {name} (ID: {letta_agent.id})")
@@ -157,14 +182,7 @@ Your personality and coding style remain the same, but forget any previous proje
         except Exception as e:
             print(f"❌ Failed to create Letta agent {name}: {e}")
             # Fallback to existing agent IDs if creation fails
-            agent_id_mapping = {
-                "One": os.getenv("LETTA_AGENT_ONE"),
-                "Two": os.getenv("LETTA_AGENT_TWO"),
-                "Three": os.getenv("LETTA_AGENT_THREE"),
-                "Four": os.getenv("LETTA_AGENT_FOUR")
-            }
-            
-            existing_agent_id = agent_id_mapping.get(name)
+            existing_agent_id = self._agent_ids.get(name)
             if not existing_agent_id:
                 raise ValueError(f"No existing Letta agent ID found for {name}")
             
@@ -179,4 +197,4 @@ Your personality and coding style remain the same, but forget any previous proje
     
     def get_agent_configs(self) -> List[Dict[str, Any]]:
         """Get the agent configuration templates."""
-        return self.agent_configs.copy()
+        return [spec._asdict() for spec in self.agent_configs]
@@ -3,13 +3,20 @@ Competitive Workflow Manager - Manages the competitive subtask cycle where all 4
 """
 
 import asyncio
+import functools
+import json
 import os
+import random
+import re
+import string
 import time
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from pathlib import Path
+from src.core.letta_utils import first_content
 
-@dataclass
+@dataclass(slots=True)
 class Subtask:
     """Represents a subtask for competitive work."""
     id: str
@@ -18,7 +25,7 @@ class Subtask:
     round_num: int
     status: str = "pending"  # pending, in_progress, completed
 
-@dataclass
+@dataclass(slots=True)
 class AgentWorkResult:
     """Result of an agent's work on a subtask."""
     agent_name: str
@@ -27,7 +34,7 @@ class AgentWorkResult:
     metadata: Dict[str, Any]
     timestamp: float
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """Represents a message in the agent chat."""
     agent_name: str
@@ -37,23 +44,338 @@ class ChatMessage:
     timestamp: float
     personality: str
 
+# Personality keyword -> approach line for fallback commentary (first match wins)
+_APPROACH_PATTERNS = (
+    (re.compile(r"perfectionist|technical", re.IGNORECASE), "🎯 Approach: Technical excellence with attention to detail"),
+    (re.compile(r"speed|fast", re.IGNORECASE), "⚡ Approach: Lightning-fast implementation with clean code"),
+    (re.compile(r"creative|design", re.IGNORECASE), "🎨 Approach: Creative solutions with beautiful UI focus"),
+    (re.compile(r"sarcastic|meme", re.IGNORECASE), "😏 Approach: Sarcastic coding with personality and humor"),
+)
+_DEFAULT_APPROACH = "💪 Approach: Solid implementation with unique perspective"
+
+# Spicy progress message pools, one message per phase per agent (start -> progress -> polish -> completion)
+PROGRESS_MESSAGE_POOLS = {
+    "start": (
+        "🔥 Starting work - time to show these amateurs how it's done!",
+        "⚡ INITIATING PROTOCOL - building something that actually works!",
+        "🎯 Mission accepted - time to drop some knowledge bombs!",
+        "🚀 Launching into battle - let's see who's really the GOAT!",
+        "💥 Entering the arena - prepare for some next-level coding!",
+        "🔥 Warming up the engines - this is about to get SPICY!",
+        "⚡ Activating beast mode - time to show what real skill looks like!",
+        "🎯 Locking and loading - prepare for some fire code!",
+        "🚀 Igniting the rockets - let's see who can keep up!",
+        "💥 Dropping into the zone - this is where legends are made!",
+    ),
+    "progress": (
+        "⚡ Implementing core functionality - building something that actually works!",
+        "🎯 Adding the magic sauce - making this bulletproof!",
+        "🔥 Crafting the perfect solution - no compromises!",
+        "⚡ Optimizing for performance - speed is everything!",
+        "🎯 Adding defensive programming - bulletproofing this beast!",
+        "🔥 Implementing type safety - no runtime surprises!",
+        "⚡ Adding accessibility features - inclusive by design!",
+        "🎯 Writing comprehensive tests - quality first!",
+        "🔥 Adding error handling - graceful failures only!",
+        "⚡ Optimizing the architecture - scalable and maintainable!",
+        "🎯 Adding documentation - future devs will thank me!",
+        "🔥 Implementing best practices - this is how it's done!",
+        "⚡ Adding performance optimizations - blazing fast!",
+        "🎯 Creating reusable components - DRY principle!",
+        "🔥 Adding security measures - locked down tight!",
+    ),
+    "polish": (
+        "🎯 Adding polish and testing - making this bulletproof!",
+        "🔥 Final touches - perfection is in the details!",
+        "⚡ Adding the finishing touches - this is art!",
+        "🎯 Quality assurance complete - bulletproof!",
+        "🔥 Adding the secret sauce - this is next level!",
+        "⚡ Final optimizations - peak performance achieved!",
+        "🎯 Code review complete - this is flawless!",
+        "🔥 Adding the cherry on top - masterpiece complete!",
+        "⚡ Final testing phase - everything checks out!",
+        "🎯 Documentation finalized - future-proofed!",
+        "🔥 Performance tuning complete - lightning fast!",
+        "⚡ Security audit passed - locked down!",
+        "🎯 Accessibility verified - inclusive design!",
+        "🔥 Code cleanup done - pristine and clean!",
+        "⚡ Final validation - this is production ready!",
+    ),
+    "completion": (
+        "🏆 Completed - another victory for the GOAT!",
+        "🔥 Mission accomplished - that's how you do it!",
+        "⚡ Victory achieved - another flawless execution!",
+        "🎯 Task completed - perfection delivered!",
+        "🔥 Another win in the books - unstoppable!",
+        "⚡ Mission successful - that's championship level!",
+        "🎯 Objective achieved - another masterpiece!",
+        "🔥 Victory secured - the GOAT strikes again!",
+        "⚡ Task completed - flawless execution!",
+        "🎯 Mission accomplished - that's skill!",
+        "🔥 Another victory - this is my domain!",
+        "⚡ Objective completed - perfection achieved!",
+        "🎯 Task finished - another masterpiece delivered!",
+        "🔥 Victory achieved - unstoppable force!",
+        "⚡ Mission complete - that's how legends are made!",
+    ),
+}
+
+# Chat banter prompts: kind -> (label, prompt template, fallback template)
+_BANTER_PROMPTS = {
+    "presentation": ("Presentation", string.Template("""
+You are $speaker. You completed: $subtask
+
+Present your approach in 1 sentence. Show your personality.
+
+Format: "I went with [approach] because [reason]."
+"""), string.Template("I built a solid solution focusing on $focus!")),
+    "critique": ("Critique", string.Template("""
+You are $speaker. Critique $target's work. Be spicy.
+
+Make it 1 sentence of pure heat!
+"""), string.Template("Your approach is interesting, $target!")),
+    "defense": ("Defense", string.Template("""
+You are $speaker. $target criticized you: "$critique"
+
+Defend your work. Be spicy and confident.
+
+Make it 1 sentence of pure fire!
+"""), string.Template("I stand by my approach, $target!")),
+    "counter_attack": ("Counter-attack", string.Template("""
+You are $speaker. Counter-attack $target. Be toxic.
+
+Make it 1 sentence of pure destruction!
+"""), string.Template("You're trash, $target!")),
+    "final_burn": ("Final burn", string.Template("""
+You are $speaker. This is your final burn - your mic drop moment!
+
+Be toxic and confident.
+
+Make it 1 sentence of pure mic drop energy!
+"""), string.Template("Mic drop. I'm done with you all!")),
+}
+
+# Subtask work prompt body; the persona prefix is prepended per agent
+_WORK_PROMPT = string.Template("""SUBTASK: $title
+Description: $description
+
+CANONICAL CODE (from previous rounds):
+$canonical_code
+
+Instructions:
+1. Build upon the canonical code if it exists
+2. Add your unique approach and personality to this subtask
+3. Generate complete, working code with BEAUTIFUL UI/UX
+4. Show your personality in comments and code style
+5. Focus on being a fullstack developer
+
+🎨 MAKE IT BEAUTIFUL - YOU HAVE ACCESS TO ALL MODERN LIBRARIES:
+
+Frontend Libraries (import freely):
+- React, Vue, Svelte, Angular - any component framework
+- Framer Motion, GSAP, Three.js, React-Spring - for animations
+- Tailwind CSS, styled-components, emotion, CSS-in-JS
+- Chart.js, D3.js, Recharts - for data visualization
+- React Icons, Lucide, Heroicons - for icons
+- date-fns, moment, dayjs - for dates
+- axios, fetch - for API calls
+- zustand, redux, jotai - for state management
+
+Styling & UI Libraries:
+- shadcn/ui, Material-UI, Chakra UI, Ant Design
+- Radix UI, Headless UI - for accessible components
+- DaisyUI, NextUI - for pre-styled components
+
+Backend/Utilities:
+- Express, Fastify, Koa - for servers
+- Prisma, TypeORM, Mongoose - for databases
+- Zod, Yup, Joi - for validation
+- Lodash, Ramda - for utilities
+
+🚀 GUIDELINES FOR BEAUTIFUL CODE:
+1. Import ANY library you need - don't limit yourself!
+2. Add smooth animations and transitions
+3. Use modern design patterns (glassmorphism, neumorphism, gradients)
+4. Include hover effects, loading states, error states
+5. Make it responsive and accessible
+6. Add micro-interactions and delightful details
+7. Use beautiful color palettes and typography
+8. Include proper TypeScript types when applicable
+9. Add helpful comments explaining your creative choices
+
+EXAMPLE of beautiful code structure:
+```tsx
+import { motion } from 'framer-motion';
+import { useSpring, animated } from 'react-spring';
+import { Bell, Heart, Star } from 'lucide-react';
+import styles from './Component.module.css';
+
+// Your beautiful, animated, feature-rich component here
+```
+
+IMPORTANT: After generating your code, also create 3-4 SPICY progress messages that show your personality and development process.
+These should be dramatic and competitive, like:
+- "🔥 Starting work on $title - time to show these amateurs how it's done!"
+- "⚡ Implementing core functionality - building something that actually works!"
+- "🎯 Adding polish and testing - making this bulletproof!"
+- "🏆 Completed $title! - another victory for the GOAT!"
+
+Make the progress messages SPICY, COMPETITIVE, and show your personality. Be dramatic and confident!
+
+Format your response as:
+CODE:
+[Your complete, beautiful, library-rich code here]
+
+PROGRESS_MESSAGES:
+1. [First progress message]
+2. [Second progress message]
+3. [Third progress message]
+4. [Fourth progress message]
+
+Generate your code and progress messages now:
+""")
+
+
+@functools.lru_cache(maxsize=32)
+def _persona_prefix(agent_name: str, personality: str, coding_style: str) -> str:
+    """Invariant "You are ..." prompt prefix for an agent."""
+    return f"""
+You are {agent_name} with this personality: {personality}
+
+Your coding style: {coding_style}
+
+"""
+
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    """Write data to path as indented JSON (blocking; run it off the event loop)."""
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
 class CompetitiveWorkflow:
     """Manages competitive workflow where all agents work on same subtask."""
     
-    def __init__(self, artifact_manager, shared_memory, message_broker, logger, client):
+    def __init__(self, artifact_manager, shared_memory, message_broker, logger, client,
+                 letta_executor: Optional[Executor] = None,
+                 async_client_factory: Optional[Callable[[], Any]] = None):
         self.artifact_manager = artifact_manager
         self.shared_memory = shared_memory
         self.message_broker = message_broker
         self.logger = logger
         self.client = client
+        self.letta_executor = letta_executor  # None -> loop's default executor
+        self.async_client_factory = async_client_factory
+        self._async_client = None  # (event loop, AsyncLetta client, httpx pool) - async clients are loop-bound
+        # Cap in-flight Letta requests so concurrent rounds don't trip provider rate limits
+        self._llm_sem = asyncio.Semaphore(max(1, int(os.environ.get("LETTA_MAX_CONCURRENCY", "4"))))
+        # Per-agent cap on a round's work so one hung Letta call can't stall the battle
+        self.agent_timeout = float(os.environ.get("AGENT_WORK_TIMEOUT", "300"))
         self.current_project_id = None
         self.current_round = 0
         self.agent_stats = {}  # Track wins per agent
+        self._ctx_snapshot: Optional[Dict[str, Any]] = None  # per-round project_context
         
         # LiveKit voice commentary components
         self.battle_context = None
         self.voice_commentator = None
         self.livekit_enabled = False
+        self._pending_announcements: List[asyncio.Task] = []  # Fire-and-forget voice commentary
+    
+    def reset(self):
+        """Clear per-project state so the workflow can be reused for another run."""
+        self.current_project_id = None
+        self.current_round = 0
+        self.agent_stats = {}
+        self._ctx_snapshot = None
+        self.battle_context = None
+        self.voice_commentator = None
+        self.livekit_enabled = False
+        # Drop announcements left over from an aborted run so they don't speak into the next project
+        for task in self._pending_announcements:
+            if not task.done():
+                task.cancel()
+        self._pending_announcements = []
+    
+    async def _get_context(self) -> Dict[str, Any]:
+        """Return the round's project_context snapshot, reading shared memory only on a miss."""
+        if self._ctx_snapshot is None:
+            self._ctx_snapshot = await self.shared_memory.read("project_context") or {}
+        return self._ctx_snapshot
+    
+    async def _write_context(self, context: Dict[str, Any]):
+        """Write project_context through to shared memory and keep it as the snapshot."""
+        await self.shared_memory.write("project_context", context)
+        self._ctx_snapshot = context
+    
+    def _get_async_client(self, loop):
+        """Native async Letta client for the running loop, or None to use the thread pool."""
+        if self.async_client_factory is None:
+            return None
+        if self._async_client is None or self._async_client[0] is not loop:
+            self._discard_async_client()
+            created = self.async_client_factory()
+            if created is None:
+                return None
+            self._async_client = (loop, *created)
+        return self._async_client[1]
+    
+    def _discard_async_client(self):
+        """Drop a client left over from another loop, closing its pool there if that loop is still running."""
+        if self._async_client is None:
+            return
+        old_loop, _, http_client = self._async_client
+        self._async_client = None
+        # A stopped loop can't run aclose(); callers close on their own loop via close_async_client()
+        if old_loop.is_running():
+            asyncio.run_coroutine_threadsafe(http_client.aclose(), old_loop)
+    
+    async def close_async_client(self):
+        """Close the async Letta client's connection pool; the next call creates a fresh one."""
+        if self._async_client is None:
+            return
+        if self._async_client[0] is not asyncio.get_running_loop():
+            self._discard_async_client()
+            return
+        http_client = self._async_client[2]
+        self._async_client = None
+        await http_client.aclose()
+    
+    async def _letta_create(self, agent_id: str, content: str):
+        """Send a user message to a Letta agent without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        messages = [{"role": "user", "content": content}]
+        async with self._llm_sem:
+            async_client = self._get_async_client(loop)
+            if async_client is not None:
+                return await async_client.agents.messages.create(agent_id=agent_id, messages=messages)
+            
+            return await loop.run_in_executor(
+                self.letta_executor,
+                lambda: self.client.agents.messages.create(agent_id=agent_id, messages=messages)
+            )
+    
+    def _announce(self, coro):
+        """Schedule side-effect-only voice commentary without blocking the caller."""
+        # Chain onto the previous announcement so clips play one at a time, in order
+        previous = self._pending_announcements[-1] if self._pending_announcements else None
+        self._pending_announcements.append(asyncio.create_task(self._announce_after(previous, coro)))
+    
+    async def _announce_after(self, previous: Optional[asyncio.Task], coro):
+        """Run an announcement once the one scheduled before it has finished."""
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])  # Ordering only; _drain_announcements reports its errors
+        except asyncio.CancelledError:
+            coro.close()
+            raise
+        await coro
+    
+    async def _drain_announcements(self):
+        """Wait for scheduled voice commentary to finish."""
+        pending, self._pending_announcements = self._pending_announcements, []
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, Exception):
+                print(f"⚠️ Voice commentary failed: {result}")
     
     async def start_competitive_project(self, project_name: str, main_task: str, 
                                       agents: List[Any], commentator, orchestrator) -> str:
@@ -69,7 +391,7 @@ class CompetitiveWorkflow:
         await self.artifact_manager.create_project_workspace(project_id, project_name)
         
         # Initialize shared memory
-        await self.shared_memory.write("project_context", {
+        await self._write_context({
             "project_id": project_id,
             "project_name": project_name,
             "canonical_code": "",
@@ -79,17 +401,15 @@ class CompetitiveWorkflow:
         })
         
         # Initialize agent stats
-        for agent in agents:
-            agent_config = agent.get("config")
-            agent_name = agent_config.name if agent_config else agent.get("name", "Unknown")
+        for agent_name, _ in self._agent_roster(agents):
             self.agent_stats[agent_name] = {"wins": 0, "total_rounds": 0}
         
         print(f"🚀 Started competitive project: {project_name} ({project_id})")
         
         # Announce battle start with voice commentary
         if self.voice_commentator:
-            await self.voice_commentator.speak_commentary("battle_start", 
-                f"Welcome to the AI coding battle! We're building: {project_name}")
+            self._announce(self.voice_commentator.speak_commentary("battle_start", 
+                f"Welcome to the AI coding battle! We're building: {project_name}"))
         
         # Use orchestrator to break down the main task
         subtasks = await orchestrator.orchestrate_project(main_task, agents)
@@ -165,6 +485,9 @@ class CompetitiveWorkflow:
         
         self.current_round = subtask.round_num
         
+        # Take a fresh project_context snapshot for this round
+        self._ctx_snapshot = None
+        
         # Update battle context and announce round start
         if self.battle_context:
             await self.battle_context.update_round_start(
@@ -174,11 +497,14 @@ class CompetitiveWorkflow:
             )
         
         if self.voice_commentator:
-            await self.voice_commentator.announce_round_start(subtask.title, subtask.round_num)
+            self._announce(self.voice_commentator.announce_round_start(subtask.title, subtask.round_num))
+        
+        # Resolve agent names/IDs once for the whole round
+        roster = self._agent_roster(agents)
         
         # Step 1: All agents work on the same subtask
         print(f"\n🔨 PHASE 1: All agents working on '{subtask.title}'...")
-        work_results = await self._all_agents_work(subtask, agents)
+        work_results = await self._all_agents_work(subtask, agents, roster)
         
         # Step 2: Quick commentary + User decision (merged)
         print(f"\n🎙️ PHASE 2: Quick analysis + User decision...")
@@ -186,112 +512,39 @@ class CompetitiveWorkflow:
         
         # Step 3: Process winner and learning
         print(f"\n🧠 PHASE 3: Processing winner...")
-        await self._process_winner(winner, work_results, agents, commentator)
+        await self._process_winner(winner, work_results, roster, commentator)
         
-        # Announce winner with voice commentary
+        # Announce winner with voice commentary (overlaps with the next round)
         if self.voice_commentator and hasattr(winner, 'agent_name'):
-            await self.voice_commentator.announce_winner(
+            self._announce(self.voice_commentator.announce_winner(
                 winner.agent_name, 
                 "User selected this approach!"
-            )
+            ))
         
         return winner
     
-    def _get_generic_progress_messages(self, agents: List[Any], subtask: Subtask) -> Dict[str, List[str]]:
-        """Get generic spicy progress messages for all agents - INSTANT!"""
-        import random
-        
-        # MASSIVE pool of spicy progress messages
-        start_messages = [
-            "🔥 Starting work - time to show these amateurs how it's done!",
-            "⚡ INITIATING PROTOCOL - building something that actually works!",
-            "🎯 Mission accepted - time to drop some knowledge bombs!",
-            "🚀 Launching into battle - let's see who's really the GOAT!",
-            "💥 Entering the arena - prepare for some next-level coding!",
-            "🔥 Warming up the engines - this is about to get SPICY!",
-            "⚡ Activating beast mode - time to show what real skill looks like!",
-            "🎯 Locking and loading - prepare for some fire code!",
-            "🚀 Igniting the rockets - let's see who can keep up!",
-            "💥 Dropping into the zone - this is where legends are made!"
-        ]
-        
-        progress_messages = [
-            "⚡ Implementing core functionality - building something that actually works!",
-            "🎯 Adding the magic sauce - making this bulletproof!",
-            "🔥 Crafting the perfect solution - no compromises!",
-            "⚡ Optimizing for performance - speed is everything!",
-            "🎯 Adding defensive programming - bulletproofing this beast!",
-            "🔥 Implementing type safety - no runtime surprises!",
-            "⚡ Adding accessibility features - inclusive by design!",
-            "🎯 Writing comprehensive tests - quality first!",
-            "🔥 Adding error handling - graceful failures only!",
-            "⚡ Optimizing the architecture - scalable and maintainable!",
-            "🎯 Adding documentation - future devs will thank me!",
-            "🔥 Implementing best practices - this is how it's done!",
-            "⚡ Adding performance optimizations - blazing fast!",
-            "🎯 Creating reusable components - DRY principle!",
-            "🔥 Adding security measures - locked down tight!"
-        ]
-        
-        polish_messages = [
-            "🎯 Adding polish and testing - making this bulletproof!",
-            "🔥 Final touches - perfection is in the details!",
-            "⚡ Adding the finishing touches - this is art!",
-            "🎯 Quality assurance complete - bulletproof!",
-            "🔥 Adding the secret sauce - this is next level!",
-            "⚡ Final optimizations - peak performance achieved!",
-            "🎯 Code review complete - this is flawless!",
-            "🔥 Adding the cherry on top - masterpiece complete!",
-            "⚡ Final testing phase - everything checks out!",
-            "🎯 Documentation finalized - future-proofed!",
-            "🔥 Performance tuning complete - lightning fast!",
-            "⚡ Security audit passed - locked down!",
-            "🎯 Accessibility verified - inclusive design!",
-            "🔥 Code cleanup done - pristine and clean!",
-            "⚡ Final validation - this is production ready!"
-        ]
-        
-        completion_messages = [
-            "🏆 Completed - another victory for the GOAT!",
-            "🔥 Mission accomplished - that's how you do it!",
-            "⚡ Victory achieved - another flawless execution!",
-            "🎯 Task completed - perfection delivered!",
-            "🔥 Another win in the books - unstoppable!",
-            "⚡ Mission successful - that's championship level!",
-            "🎯 Objective achieved - another masterpiece!",
-            "🔥 Victory secured - the GOAT strikes again!",
-            "⚡ Task completed - flawless execution!",
-            "🎯 Mission accomplished - that's skill!",
-            "🔥 Another victory - this is my domain!",
-            "⚡ Objective completed - perfection achieved!",
-            "🎯 Task finished - another masterpiece delivered!",
-            "🔥 Victory achieved - unstoppable force!",
-            "⚡ Mission complete - that's how legends are made!"
-        ]
-        
-        # Assign random messages to each agent
-        planned_messages = {}
+    @staticmethod
+    def _agent_roster(agents: List[Any]) -> Tuple[Tuple[str, str], ...]:
+        """Resolve (name, agent_id) for each agent, in the same order as agents."""
+        roster = []
         for agent in agents:
             agent_config = agent.get("config")
             if agent_config:
-                agent_name = agent_config.name
+                roster.append((agent_config.name, agent_config.agent_id))
             else:
-                agent_name = agent.get("name", "Unknown")
-            
-            # Pick random messages for this agent
-            planned_messages[agent_name] = [
-                random.choice(start_messages),
-                random.choice(progress_messages),
-                random.choice(polish_messages),
-                random.choice(completion_messages)
-            ]
-        
-        return planned_messages
+                roster.append((agent.get("name", "Unknown"), agent.get("agent_id", "")))
+        return tuple(roster)
+    
+    def _get_generic_progress_messages(self, roster: Tuple[Tuple[str, str], ...], subtask: Subtask) -> Dict[str, List[str]]:
+        """Get generic spicy progress messages for all agents - INSTANT!"""
+        # Pick random messages for each agent
+        return {
+            agent_name: [random.choice(pool) for pool in PROGRESS_MESSAGE_POOLS.values()]
+            for agent_name, _ in roster
+        }
     
     async def _simulate_real_time_progress(self, planned_messages: Dict[str, List[str]], tasks: List[asyncio.Task]):
         """Simulate real-time progress using planned messages."""
-        import random
-        
         # Create a timeline of all progress messages (FASTER!)
         timeline = []
         for agent_name, messages in planned_messages.items():
@@ -307,11 +560,13 @@ class CompetitiveWorkflow:
         timeline.sort(key=lambda x: x['delay'])
         
         # Show progress messages in real-time
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        reported = set()
         
         for event in timeline:
-            # Wait for the delay
-            await asyncio.sleep(event['delay'])
+            # Delays are offsets from the start, so only wait out the remainder
+            await asyncio.sleep(max(0.0, event['delay'] - (loop.time() - start_time)))
             
             # Show the progress message
             print(f"\n🔥 {event['agent']} PROGRESS UPDATE:")
@@ -322,14 +577,14 @@ class CompetitiveWorkflow:
                 await self.battle_context.update_agent_progress(event['agent'], event['message'])
             
             if self.voice_commentator:
-                await self.voice_commentator.announce_agent_progress(event['agent'], event['message'])
+                self._announce(self.voice_commentator.announce_agent_progress(event['agent'], event['message']))
             
-            # Check if any tasks are done
-            done_tasks = [task for task in tasks if task.done()]
-            if done_tasks:
-                for task in done_tasks:
+            # Report each agent as soon as it finishes, exactly once
+            for task in tasks:
+                if task.done() and task not in reported:
+                    reported.add(task)
                     try:
-                        result = await task
+                        result = task.result()
                         if hasattr(result, 'agent_name'):
                             print(f"✅ {result.agent_name} completed their solution!")
                     except Exception as e:
@@ -337,6 +592,7 @@ class CompetitiveWorkflow:
         
         # Wait for any remaining tasks
         await asyncio.gather(*tasks, return_exceptions=True)
+        await self._drain_announcements()
         print(f"\n🎉 ALL AGENTS COMPLETE!")
     
     async def _quick_commentary_and_decision(self, work_results: List[AgentWorkResult], 
@@ -344,6 +600,11 @@ class CompetitiveWorkflow:
         """Quick commentary + user decision in one phase."""
         print(f"\n🎙️ QUICK ANALYSIS:")
         
+        # Nothing to compare - skip the commentator round-trip
+        if len(work_results) < 2:
+            print(f"🎙️ Only {len(work_results)} approach submitted - straight to the decision!")
+            return await self._get_user_decision(work_results, subtask)
+        
         # Quick analysis
         analysis_prompt = f"""
 Quick analysis of {len(work_results)} approaches for: {subtask.title}
@@ -354,17 +615,9 @@ Give a 2-sentence analysis: Who's the MVP and why? Be exciting!
 """
         
         try:
-            response = self.client.agents.messages.create(
-                agent_id=commentator.agent_id,
-                messages=[{"role": "user", "content": analysis_prompt}]
-            )
+            response = await self._letta_create(commentator.agent_id, analysis_prompt)
             
-            analysis = ""
-            if hasattr(response, 'messages') and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, 'content') and msg.content:
-                        analysis = msg.content.strip()
-                        break
+            analysis = first_content(response)
             
             if analysis:
                 print(f"🎙️ {analysis}")
@@ -378,65 +631,72 @@ Give a 2-sentence analysis: Who's the MVP and why? Be exciting!
         # User decision
         return await self._get_user_decision(work_results, subtask)
     
-    async def _all_agents_work(self, subtask: Subtask, agents: List[Any]) -> List[AgentWorkResult]:
+    async def _all_agents_work(self, subtask: Subtask, agents: List[Any],
+                               roster: Tuple[Tuple[str, str], ...]) -> List[AgentWorkResult]:
         """All agents work on the same subtask in parallel with exciting commentary."""
         work_results = []
         
         # Get current canonical code
-        shared_context = await self.shared_memory.read("project_context") or {}
+        shared_context = await self._get_context()
         canonical_code = shared_context.get("canonical_code", "")
         
         # Phase 1: Exciting work start commentary
         print(f"\n🔥 PHASE 1 COMMENTARY: The coding battle begins!")
         print(f"🎯 Mission: {subtask.title}")
         print(f"📝 Description: {subtask.description}")
-        print(f"🤖 Competitors: {', '.join([agent.get('config', {}).name or agent.get('name', 'Unknown') for agent in agents])}")
+        print(f"🤖 Competitors: {', '.join(name for name, _ in roster)}")
         print(f"⚡ All agents are diving into their coding environments...")
         
-        # Create work tasks for all agents
-        work_tasks = []
-        for agent in agents:
-            task = self._agent_work_on_subtask(agent, subtask, canonical_code)
-            work_tasks.append(task)
-        
         # Step 1: Get generic progress messages INSTANTLY
         print(f"🚀 Generating battle plans...")
-        planned_messages = self._get_generic_progress_messages(agents, subtask)
+        planned_messages = self._get_generic_progress_messages(roster, subtask)
         
         # Step 2: Execute all agents in parallel with simulated real-time progress
         print(f"🚀 Launching parallel coding sessions...")
         
-        # Start all tasks
-        tasks = [asyncio.create_task(task) for task in work_tasks]
-        
-        # Simulate real-time progress using planned messages
-        await self._simulate_real_time_progress(planned_messages, tasks)
-        
-        # Get all results
-        results = []
-        for task in tasks:
-            try:
-                result = await task
-                results.append(result)
-            except Exception as e:
-                results.append(e)
+        # Start all tasks; each agent is bounded by its own timeout, so the group never stalls
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._agent_work_with_timeout(agent, subtask, canonical_code))
+                for agent in agents
+            ]
+            
+            # Simulate real-time progress using planned messages
+            await self._simulate_real_time_progress(planned_messages, tasks)
         
         # Process results with exciting commentary
         print(f"\n🎉 PHASE 1 COMPLETE: All agents have finished coding!")
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                # Extract agent name from factory structure
-                agent_config = agents[i].get("config")
-                agent_name = agent_config.name if agent_config else agents[i].get("name", "Unknown")
-                print(f"❌ {agent_name} encountered an error: {result}")
+        for task in tasks:
+            result = task.result()
+            # Failed agents come back with empty metadata and the error in place of code; they don't compete
+            if not result.metadata:
+                print(f"❌ {result.agent_name} encountered an error: {result.code.removeprefix('// Error: ')}")
                 continue
             
             work_results.append(result)
             print(f"✅ {result.agent_name} delivered their solution!")
         
         print(f"🏆 All {len(work_results)} agents completed their implementations!")
+        await self._flush_round_artifacts(subtask, work_results)
         return work_results
     
+    async def _flush_round_artifacts(self, subtask: Subtask, work_results: List[AgentWorkResult]):
+        """Save every agent's round artifact in one batch at the end of the subtask."""
+        outcomes = await asyncio.gather(*(
+            self.artifact_manager.save_agent_round(
+                self.current_project_id,
+                result.agent_name,
+                subtask.round_num,
+                result.code,
+                result.metadata
+            )
+            for result in work_results
+        ), return_exceptions=True)
+        
+        for result, outcome in zip(work_results, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"⚠️ Failed to save {result.agent_name}'s round artifact: {outcome}")
+    
     async def _smart_batch_commentary(self, work_results: List[AgentWorkResult], subtask: Subtask, commentator: Any):
         """Generate exciting batch commentary after all agents finish work."""
         if not work_results:
@@ -478,18 +738,10 @@ Make it exciting! Use emojis. Format: 1-2 sentences per agent + summary.
         
         try:
             # Send batch analysis to commentator with better error handling
-            response = self.client.agents.messages.create(
-                agent_id=commentator.agent_id,
-                messages=[{"role": "user", "content": batch_prompt}]
-            )
+            response = await self._letta_create(commentator.agent_id, batch_prompt)
             
             # Extract and display the exciting analysis
-            analysis = ""
-            if hasattr(response, 'messages') and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, 'content') and msg.content:
-                        analysis = msg.content.strip()
-                        break
+            analysis = first_content(response)
             
             if analysis:
                 print(f"\n🎙️ COMMENTATOR BATCH ANALYSIS:")
@@ -521,16 +773,9 @@ Make it exciting! Use emojis. Format: 1-2 sentences per agent + summary.
                 print(f"   Progress: {' → '.join(progress_messages)}")
             
             # Generate personality-based commentary
-            if "perfectionist" in personality.lower() or "technical" in personality.lower():
-                print(f"   🎯 Approach: Technical excellence with attention to detail")
-            elif "speed" in personality.lower() or "fast" in personality.lower():
-                print(f"   ⚡ Approach: Lightning-fast implementation with clean code")
-            elif "creative" in personality.lower() or "design" in personality.lower():
-                print(f"   🎨 Approach: Creative solutions with beautiful UI focus")
-            elif "sarcastic" in personality.lower() or "meme" in personality.lower():
-                print(f"   😏 Approach: Sarcastic coding with personality and humor")
-            else:
-                print(f"   💪 Approach: Solid implementation with unique perspective")
+            approach = next((line for pattern, line in _APPROACH_PATTERNS if pattern.search(personality)),
+                            _DEFAULT_APPROACH)
+            print(f"   {approach}")
         
         print(f"\n🏆 Overall: All agents brought their unique personalities to {subtask.title}!")
         print(f"🚀 Ready for user selection and the next round!")
@@ -538,15 +783,32 @@ Make it exciting! Use emojis. Format: 1-2 sentences per agent + summary.
     
     def _format_agent_summaries(self, agent_summaries: List[Dict]) -> str:
         """Format agent summaries for batch analysis."""
-        formatted = ""
-        for summary in agent_summaries:
-            formatted += f"""
+        return "".join(f"""
 🤖 {summary['name']} ({summary['personality']}):
    Progress: {' → '.join(summary['progress'])}
    Code Preview: {summary['code_preview']}
    Approach: {summary['approach']}
-"""
-        return formatted
+""" for summary in agent_summaries)
+    
+    async def _agent_work_with_timeout(self, agent: Dict[str, Any], subtask: Subtask,
+                                       canonical_code: str) -> AgentWorkResult:
+        """Run one agent's work, turning a timeout or failure into an error result."""
+        # Never let one agent's exception escape: it would cancel the whole TaskGroup
+        try:
+            async with asyncio.timeout(self.agent_timeout):
+                return await self._agent_work_on_subtask(agent, subtask, canonical_code)
+        except TimeoutError:
+            error = f"timed out after {self.agent_timeout:.0f}s"
+        except Exception as e:
+            error = str(e)
+        agent_name, agent_id = self._agent_roster([agent])[0]
+        return AgentWorkResult(
+            agent_name=agent_name,
+            agent_id=agent_id,
+            code=f"// Error: {error}",
+            metadata={},
+            timestamp=time.time()
+        )
     
     async def _agent_work_on_subtask(self, agent: Dict[str, Any], subtask: Subtask, 
                                    canonical_code: str) -> AgentWorkResult:
@@ -567,89 +829,11 @@ Make it exciting! Use emojis. Format: 1-2 sentences per agent + summary.
         print(f"  🔨 {agent_name} working on: {subtask.title}")
         
         # Create work prompt that includes progress message generation
-        work_prompt = f"""
-You are {agent_name} with this personality: {personality}
-
-Your coding style: {coding_style}
-
-SUBTASK: {subtask.title}
-Description: {subtask.description}
-
-CANONICAL CODE (from previous rounds):
-{canonical_code if canonical_code else "No previous code - this is the first subtask"}
-
-Instructions:
-1. Build upon the canonical code if it exists
-2. Add your unique approach and personality to this subtask
-3. Generate complete, working code with BEAUTIFUL UI/UX
-4. Show your personality in comments and code style
-5. Focus on being a fullstack developer
-
-🎨 MAKE IT BEAUTIFUL - YOU HAVE ACCESS TO ALL MODERN LIBRARIES:
-
-Frontend Libraries (import freely):
-- React, Vue, Svelte, Angular - any component framework
-- Framer Motion, GSAP, Three.js, React-Spring - for animations
-- Tailwind CSS, styled-components, emotion, CSS-in-JS
-- Chart.js, D3.js, Recharts - for data visualization
-- React Icons, Lucide, Heroicons - for icons
-- date-fns, moment, dayjs - for dates
-- axios, fetch - for API calls
-- zustand, redux, jotai - for state management
-
-Styling & UI Libraries:
-- shadcn/ui, Material-UI, Chakra UI, Ant Design
-- Radix UI, Headless UI - for accessible components
-- DaisyUI, NextUI - for pre-styled components
-
-Backend/Utilities:
-- Express, Fastify, Koa - for servers
-- Prisma, TypeORM, Mongoose - for databases
-- Zod, Yup, Joi - for validation
-- Lodash, Ramda - for utilities
-
-🚀 GUIDELINES FOR BEAUTIFUL CODE:
-1. Import ANY library you need - don't limit yourself!
-2. Add smooth animations and transitions
-3. Use modern design patterns (glassmorphism, neumorphism, gradients)
-4. Include hover effects, loading states, error states
-5. Make it responsive and accessible
-6. Add micro-interactions and delightful details
-7. Use beautiful color palettes and typography
-8. Include proper TypeScript types when applicable
-9. Add helpful comments explaining your creative choices
-
-EXAMPLE of beautiful code structure:
-```tsx
-import {{ motion }} from 'framer-motion';
-import {{ useSpring, animated }} from 'react-spring';
-import {{ Bell, Heart, Star }} from 'lucide-react';
-import styles from './Component.module.css';
-
-// Your beautiful, animated, feature-rich component here
-```
-
-IMPORTANT: After generating your code, also create 3-4 SPICY progress messages that show your personality and development process.
-These should be dramatic and competitive, like:
-- "🔥 Starting work on {subtask.title} - time to show these amateurs how it's done!"
-- "⚡ Implementing core functionality - building something that actually works!"
-- "🎯 Adding polish and testing - making this bulletproof!"
-- "🏆 Completed {subtask.title}! - another victory for the GOAT!"
-
-Make the progress messages SPICY, COMPETITIVE, and show your personality. Be dramatic and confident!
-
-Format your response as:
-CODE:
-[Your complete, beautiful, library-rich code here]
-
-PROGRESS_MESSAGES:
-1. [First progress message]
-2. [Second progress message]
-3. [Third progress message]
-4. [Fourth progress message]
-
-Generate your code and progress messages now:
-"""
+        work_prompt = _persona_prefix(agent_name, personality, coding_style) + _WORK_PROMPT.substitute(
+            title=subtask.title,
+            description=subtask.description,
+            canonical_code=canonical_code if canonical_code else "No previous code - this is the first subtask"
+        )
         
         try:
             # Call Letta API to generate code and progress messages
@@ -673,14 +857,7 @@ Generate your code and progress messages now:
             }
             
             # Save to artifacts
-            await self.artifact_manager.save_agent_round(
-                self.current_project_id, 
-                agent_name, 
-                subtask.round_num, 
-                code, 
-                metadata
-            )
-            
+            # Artifact is saved by _flush_round_artifacts once all agents finish
             return AgentWorkResult(
                 agent_name=agent_name,
                 agent_id=agent_id,
@@ -719,17 +896,11 @@ Generate your code and progress messages now:
         
         try:
             # Call Letta API to generate code using the client
-            response = self.client.agents.messages.create(
-                agent_id=letta_agent["agent_id"],
-                messages=[{"role": "user", "content": prompt}]
-            )
+            response = await self._letta_create(letta_agent["agent_id"], prompt)
             
             # Extract code from response
-            code = ""
-            for msg in response.messages:
-                if msg.message_type == "assistant_message":
-                    code = msg.content.strip()
-                    break
+            code = next((msg.content.strip() for msg in response.messages
+                         if msg.message_type == "assistant_message"), "")
             
             if not code:
                 code = f"// {agent_name} - No code generated\n// Error: Empty response from Letta"
@@ -753,7 +924,9 @@ Generate your code and progress messages now:
         print(f"\n🎤 PRESENTATION ROUND:")
         presentation_tasks = []
         for result in work_results:
-            task = self._generate_agent_presentation(result, work_results)
+            task = self._emit("presentation", result,
+                              subtask=result.metadata.get('subtask', 'Unknown'),
+                              focus=result.metadata.get('subtask', 'the task'))
             presentation_tasks.append(task)
         
         # Execute all presentations in parallel
@@ -791,34 +964,20 @@ Generate your code and progress messages now:
         
         return chat_messages
     
-    async def _generate_agent_presentation(self, result: AgentWorkResult, all_results: List[AgentWorkResult]) -> str:
-        """Generate an agent's presentation of their work."""
-        presentation_prompt = f"""
-You are {result.agent_name}. You completed: {result.metadata.get('subtask', 'Unknown')}
-
-Present your approach in 1 sentence. Show your personality.
-
-Format: "I went with [approach] because [reason]."
-"""
+    async def _emit(self, kind: str, speaker: AgentWorkResult, **template_vars) -> str:
+        """Generate one chat line of the given kind for speaker, falling back on failure."""
+        label, prompt_template, fallback_template = _BANTER_PROMPTS[kind]
+        template_vars["speaker"] = speaker.agent_name
+        fallback = fallback_template.safe_substitute(template_vars)
         
         try:
-            response = self.client.agents.messages.create(
-                agent_id=result.agent_id,
-                messages=[{"role": "user", "content": presentation_prompt}]
-            )
-            
-            presentation = ""
-            if hasattr(response, 'messages') and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, 'content') and msg.content:
-                        presentation = msg.content.strip()
-                        break
+            response = await self._letta_create(speaker.agent_id, prompt_template.safe_substitute(template_vars))
             
-            return presentation if presentation else f"I built a solid solution focusing on {result.metadata.get('subtask', 'the task')}!"
+            return first_content(response) or fallback
             
         except Exception as e:
-            print(f"❌ Presentation generation failed for {result.agent_name}: {e}")
-            return f"I built a solid solution focusing on {result.metadata.get('subtask', 'the task')}!"
+            print(f"❌ {label} generation failed for {speaker.agent_name}: {e}")
+            return fallback
     
     async def _generate_agent_discussions(self, work_results: List[AgentWorkResult], chat_messages: List[ChatMessage]) -> List[ChatMessage]:
         """Generate SPICY agent discussions and heated arguments."""
@@ -831,7 +990,7 @@ Format: "I went with [approach] because [reason]."
             target_index = (i + 1) % len(work_results)
             target_result = work_results[target_index]
             
-            critique = await self._generate_agent_critique(result, target_result, chat_messages)
+            critique = await self._emit("critique", result, target=target_result.agent_name)
             critique_message = ChatMessage(
                 agent_name=result.agent_name,
                 agent_id=result.agent_id,
@@ -846,7 +1005,7 @@ Format: "I went with [approach] because [reason]."
             print(f"   {critique}")
             
             # Target agent defends their approach
-            defense = await self._generate_agent_defense(target_result, result, critique)
+            defense = await self._emit("defense", target_result, target=result.agent_name, critique=critique)
             defense_message = ChatMessage(
                 agent_name=target_result.agent_name,
                 agent_id=target_result.agent_id,
@@ -861,13 +1020,13 @@ Format: "I went with [approach] because [reason]."
             print(f"   {defense}")
         
         print(f"\n🔥 ROUND 2: Counter-Attacks")
-        # Round 2: Counter-attacks and follow-up burns
-        for i, result in enumerate(work_results):
-            # Pick a different agent to attack
-            target_index = (i + 2) % len(work_results)
-            target_result = work_results[target_index]
-            
-            counter_attack = await self._generate_counter_attack(result, target_result, discussion_messages)
+        # Round 2: Counter-attacks and follow-up burns (one call per agent, so run them together)
+        targets = [work_results[(i + 2) % len(work_results)] for i in range(len(work_results))]
+        counter_attacks = await asyncio.gather(*(
+            self._emit("counter_attack", result, target=target_result.agent_name)
+            for result, target_result in zip(work_results, targets)
+        ))
+        for result, target_result, counter_attack in zip(work_results, targets, counter_attacks):
             counter_message = ChatMessage(
                 agent_name=result.agent_name,
                 agent_id=result.agent_id,
@@ -883,8 +1042,8 @@ Format: "I went with [approach] because [reason]."
         
         print(f"\n🔥 ROUND 3: Final Burns")
         # Round 3: Final burns and mic drops
-        for i, result in enumerate(work_results):
-            final_burn = await self._generate_final_burn(result, work_results, discussion_messages)
+        final_burns = await asyncio.gather(*(self._emit("final_burn", result) for result in work_results))
+        for result, final_burn in zip(work_results, final_burns):
             burn_message = ChatMessage(
                 agent_name=result.agent_name,
                 agent_id=result.agent_id,
@@ -900,124 +1059,9 @@ Format: "I went with [approach] because [reason]."
         
         return discussion_messages
     
-    async def _generate_agent_critique(self, critic: AgentWorkResult, target: AgentWorkResult, chat_messages: List[ChatMessage]) -> str:
-        """Generate a critique from one agent to another."""
-        critique_prompt = f"""
-You are {critic.agent_name}. Critique {target.agent_name}'s work. Be spicy.
-
-Make it 1 sentence of pure heat!
-"""
-        
-        try:
-            response = self.client.agents.messages.create(
-                agent_id=critic.agent_id,
-                messages=[{"role": "user", "content": critique_prompt}]
-            )
-            
-            critique = ""
-            if hasattr(response, 'messages') and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, 'content') and msg.content:
-                        critique = msg.content.strip()
-                        break
-            
-            return critique if critique else f"Your approach is interesting, {target.agent_name}!"
-            
-        except Exception as e:
-            print(f"❌ Critique generation failed for {critic.agent_name}: {e}")
-            return f"Your approach is interesting, {target.agent_name}!"
-    
-    async def _generate_agent_defense(self, defender: AgentWorkResult, critic: AgentWorkResult, critique: str) -> str:
-        """Generate a defense response from an agent."""
-        defense_prompt = f"""
-You are {defender.agent_name}. {critic.agent_name} criticized you: "{critique}"
-
-Defend your work. Be spicy and confident.
-
-Make it 1 sentence of pure fire!
-"""
-        
-        try:
-            response = self.client.agents.messages.create(
-                agent_id=defender.agent_id,
-                messages=[{"role": "user", "content": defense_prompt}]
-            )
-            
-            defense = ""
-            if hasattr(response, 'messages') and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, 'content') and msg.content:
-                        defense = msg.content.strip()
-                        break
-            
-            return defense if defense else f"I stand by my approach, {critic.agent_name}!"
-            
-        except Exception as e:
-            print(f"❌ Defense generation failed for {defender.agent_name}: {e}")
-            return f"I stand by my approach, {critic.agent_name}!"
-    
-    async def _generate_counter_attack(self, attacker: AgentWorkResult, target: AgentWorkResult, chat_messages: List[ChatMessage]) -> str:
-        """Generate a counter-attack from one agent to another."""
-        counter_prompt = f"""
-You are {attacker.agent_name}. Counter-attack {target.agent_name}. Be toxic.
-
-Make it 1 sentence of pure destruction!
-"""
-        
-        try:
-            response = self.client.agents.messages.create(
-                agent_id=attacker.agent_id,
-                messages=[{"role": "user", "content": counter_prompt}]
-            )
-            
-            counter_attack = ""
-            if hasattr(response, 'messages') and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, 'content') and msg.content:
-                        counter_attack = msg.content.strip()
-                        break
-            
-            return counter_attack if counter_attack else f"You're trash, {target.agent_name}!"
-            
-        except Exception as e:
-            print(f"❌ Counter-attack generation failed for {attacker.agent_name}: {e}")
-            return f"You're trash, {target.agent_name}!"
-    
-    async def _generate_final_burn(self, agent: AgentWorkResult, all_results: List[AgentWorkResult], chat_messages: List[ChatMessage]) -> str:
-        """Generate a final burn/mic drop from an agent."""
-        burn_prompt = f"""
-You are {agent.agent_name}. This is your final burn - your mic drop moment!
-
-Be toxic and confident.
-
-Make it 1 sentence of pure mic drop energy!
-"""
-        
-        try:
-            response = self.client.agents.messages.create(
-                agent_id=agent.agent_id,
-                messages=[{"role": "user", "content": burn_prompt}]
-            )
-            
-            final_burn = ""
-            if hasattr(response, 'messages') and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, 'content') and msg.content:
-                        final_burn = msg.content.strip()
-                        break
-            
-            return final_burn if final_burn else f"Mic drop. I'm done with you all!"
-            
-        except Exception as e:
-            print(f"❌ Final burn generation failed for {agent.agent_name}: {e}")
-            return f"Mic drop. I'm done with you all!"
-    
     def _format_recent_chat(self, recent_messages: List[ChatMessage]) -> str:
         """Format recent chat messages for context."""
-        formatted = ""
-        for msg in recent_messages:
-            formatted += f"\n{msg.agent_name}: {msg.message}"
-        return formatted
+        return "".join(f"\n{msg.agent_name}: {msg.message}" for msg in recent_messages)
     
     async def _save_chat_data(self, chat_messages: List[ChatMessage], subtask: str):
         """Save chat data for frontend display."""
@@ -1047,9 +1091,7 @@ Make it 1 sentence of pure mic drop energy!
             # Save to project artifacts
             if self.current_project_id:
                 chat_file = f"artifacts/{self.current_project_id}/chat_session_{int(time.time())}.json"
-                import json
-                with open(chat_file, 'w') as f:
-                    json.dump(chat_summary, f, indent=2)
+                await asyncio.to_thread(_write_json, chat_file, chat_summary)
                 
                 print(f"💾 Chat data saved to: {chat_file}")
             
@@ -1080,17 +1122,9 @@ Make it engaging! Use emojis. Format: 1-2 sentences per section.
 """
         
         try:
-            response = self.client.agents.messages.create(
-                agent_id=commentator.agent_id,
-                messages=[{"role": "user", "content": chat_summary_prompt}]
-            )
+            response = await self._letta_create(commentator.agent_id, chat_summary_prompt)
             
-            summary = ""
-            if hasattr(response, 'messages') and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, 'content') and msg.content:
-                        summary = msg.content.strip()
-                        break
+            summary = first_content(response)
             
             if summary:
                 print(summary)
@@ -1107,17 +1141,22 @@ Make it engaging! Use emojis. Format: 1-2 sentences per section.
     
     def _format_chat_for_summary(self, chat_messages: List[ChatMessage]) -> str:
         """Format chat messages for commentator summary."""
-        formatted = ""
-        for msg in chat_messages:
-            timestamp = time.strftime('%H:%M:%S', time.localtime(msg.timestamp))
-            formatted += f"\n[{timestamp}] {msg.agent_name} ({msg.message_type}): {msg.message}"
-        return formatted
+        return "".join(
+            f"\n[{time.strftime('%H:%M:%S', time.localtime(msg.timestamp))}] "
+            f"{msg.agent_name} ({msg.message_type}): {msg.message}"
+            for msg in chat_messages
+        )
     
     async def _generate_fallback_chat_summary(self, chat_messages: List[ChatMessage], subtask: Subtask):
         """Generate fallback chat summary when Letta fails."""
-        presentations = [msg for msg in chat_messages if msg.message_type == "presentation"]
-        critiques = [msg for msg in chat_messages if msg.message_type == "critique"]
-        defenses = [msg for msg in chat_messages if msg.message_type == "defense"]
+        # Single pass: group by message type and note each personality's first speaker
+        by_type = {"presentation": [], "critique": [], "defense": []}
+        personalities = {}
+        for msg in chat_messages:
+            if msg.message_type in by_type:
+                by_type[msg.message_type].append(msg)
+            personalities.setdefault(msg.personality, msg.agent_name)
+        presentations, critiques, defenses = by_type["presentation"], by_type["critique"], by_type["defense"]
         
         print(f"\n🎤 PRESENTATION HIGHLIGHTS:")
         for msg in presentations:
@@ -1129,10 +1168,6 @@ Make it engaging! Use emojis. Format: 1-2 sentences per section.
                 print(f"   • {critique.agent_name} critiqued → {defenses[i].agent_name} defended")
         
         print(f"\n🔥 PERSONALITY SHOWCASE:")
-        personalities = {}
-        for msg in chat_messages:
-            if msg.personality not in personalities:
-                personalities[msg.personality] = msg.agent_name
         for personality, agent in personalities.items():
             print(f"   • {agent}: {personality}")
         
@@ -1141,27 +1176,34 @@ Make it engaging! Use emojis. Format: 1-2 sentences per section.
     async def _get_user_decision(self, work_results: List[AgentWorkResult], 
                                subtask: Subtask) -> AgentWorkResult:
         """Get user decision on which approach to pick with interactive selection."""
-        print(f"\n👑 PHASE 4: USER DECISION TIME!")
-        print(f"{'='*60}")
-        print(f"🎯 Subtask: {subtask.title}")
-        print(f"📝 Description: {subtask.description}")
-        print(f"🤖 {len(work_results)} agents have submitted their approaches:")
+        lines = [
+            f"\n👑 PHASE 4: USER DECISION TIME!",
+            f"{'='*60}",
+            f"🎯 Subtask: {subtask.title}",
+            f"📝 Description: {subtask.description}",
+            f"🤖 {len(work_results)} agents have submitted their approaches:",
+        ]
         
         # Display all agent approaches
         for i, result in enumerate(work_results, 1):
             personality = result.metadata.get('personality', 'Unknown')
             code_preview = result.code[:200] + "..." if len(result.code) > 200 else result.code
             
-            print(f"\n{i}. 🤖 {result.agent_name} ({personality})")
-            print(f"   Code Preview: {code_preview}")
-            print(f"   Progress: {' → '.join(result.metadata.get('progress_messages', []))}")
+            lines.append(f"\n{i}. 🤖 {result.agent_name} ({personality})")
+            lines.append(f"   Code Preview: {code_preview}")
+            lines.append(f"   Progress: {' → '.join(result.metadata.get('progress_messages', []))}")
         
-        print(f"\n{'='*60}")
+        lines.append(f"\n{'='*60}")
+        # One write for the whole block
+        print("\n".join(lines))
         
         # Get user choice
         while True:
             try:
-                choice = input(f"\n🎯 Which agent's approach do you like best? (1-{len(work_results)}): ").strip()
+                # Read stdin off the event loop so background narration keeps running
+                choice = (await asyncio.to_thread(
+                    input, f"\n🎯 Which agent's approach do you like best? (1-{len(work_results)}): "
+                )).strip()
                 choice_num = int(choice)
                 
                 if 1 <= choice_num <= len(work_results):
@@ -1174,7 +1216,9 @@ Make it engaging! Use emojis. Format: 1-2 sentences per section.
         
         # Get user explanation
         print(f"\n🏆 You selected: {winner.agent_name}")
-        explanation = input(f"💭 Why do you like {winner.agent_name}'s approach? Explain what caught your attention: ").strip()
+        explanation = (await asyncio.to_thread(
+            input, f"💭 Why do you like {winner.agent_name}'s approach? Explain what caught your attention: "
+        )).strip()
         
         if explanation:
             print(f"\n💭 Your reasoning: {explanation}")
@@ -1217,9 +1261,7 @@ Make it engaging! Use emojis. Format: 1-2 sentences per section.
             # Save to project artifacts
             if self.current_project_id:
                 feedback_file = f"artifacts/{self.current_project_id}/user_feedback_round_{subtask.round_num}.json"
-                import json
-                with open(feedback_file, 'w') as f:
-                    json.dump(feedback_data, f, indent=2)
+                await asyncio.to_thread(_write_json, feedback_file, feedback_data)
                 
                 print(f"💾 User feedback saved to: {feedback_file}")
             
@@ -1227,29 +1269,26 @@ Make it engaging! Use emojis. Format: 1-2 sentences per section.
             print(f"❌ Failed to save user feedback: {e}")
     
     async def _process_winner(self, winner: AgentWorkResult, work_results: List[AgentWorkResult], 
-                            agents: List[Any], commentator):
+                            roster: Tuple[Tuple[str, str], ...], commentator):
         """Process the winner and update learning."""
         # Update agent stats
         if winner.agent_name in self.agent_stats:
             self.agent_stats[winner.agent_name]["wins"] += 1
-        for agent in agents:
-            agent_config = agent.get("config")
-            agent_name = agent_config.name if agent_config else agent.get("name", "Unknown")
+        for agent_name, _ in roster:
             if agent_name in self.agent_stats:
                 self.agent_stats[agent_name]["total_rounds"] += 1
         
-        # Generate winner analysis
-        analysis = await commentator.analyze_winner(winner, work_results)
+        async def analyze_and_teach():
+            # Generate winner analysis, then send learning to all agents
+            analysis = await commentator.analyze_winner(winner, work_results)
+            await self._send_learning_to_agents(roster, winner, analysis)
         
-        # Send learning to all agents
-        await self._send_learning_to_agents(agents, winner, analysis)
-        
-        # Update canonical code
-        await self._update_canonical_code(winner)
+        # The canonical code update doesn't depend on the analysis, so run both branches together
+        await asyncio.gather(analyze_and_teach(), self._update_canonical_code(winner))
         
         print(f"  🧠 Learning processed for {winner.agent_name}")
     
-    async def _send_learning_to_agents(self, agents: List[Any], winner: AgentWorkResult, 
+    async def _send_learning_to_agents(self, roster: Tuple[Tuple[str, str], ...], winner: AgentWorkResult, 
                                      analysis: str):
         """Send learning analysis to all agents via Letta."""
         learning_message = f"""
@@ -1277,33 +1316,28 @@ Next round: Build upon the winning approach!
         
         print(f"  📚 Sending learning analysis to all agents...")
         
-        # Actually send learning to each agent via Letta
-        for agent in agents:
-            try:
-                agent_config = agent.get("config")
-                agent_name = agent_config.name if agent_config else agent.get("name", "Unknown")
-                agent_id = agent_config.agent_id if agent_config else agent.get("agent_id", "")
-                
-                if agent_id:
-                    # Send learning message to agent
-                    response = self.client.agents.messages.create(
-                        agent_id=agent_id,
-                        messages=[{"role": "user", "content": learning_message}]
-                    )
-                    
-                    print(f"    ✅ Learning sent to {agent_name}")
-                else:
-                    print(f"    ❌ No agent ID for {agent_name}")
-                    
-            except Exception as e:
-                print(f"    ❌ Failed to send learning to {agent_name}: {e}")
+        # Send learning to every agent via Letta concurrently
+        recipients = [(agent_name, agent_id) for agent_name, agent_id in roster if agent_id]
+        for agent_name, agent_id in roster:
+            if not agent_id:
+                print(f"    ❌ No agent ID for {agent_name}")
+        
+        outcomes = await asyncio.gather(
+            *(self._letta_create(agent_id, learning_message) for _, agent_id in recipients),
+            return_exceptions=True
+        )
+        for (agent_name, _), outcome in zip(recipients, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"    ❌ Failed to send learning to {agent_name}: {outcome}")
+            else:
+                print(f"    ✅ Learning sent to {agent_name}")
         
         print(f"  🎉 Learning analysis complete!")
     
     async def _update_canonical_code(self, winner: AgentWorkResult):
         """Update canonical code with winner's code."""
         # Update shared memory
-        shared_context = await self.shared_memory.read("project_context") or {}
+        shared_context = await self._get_context()
         shared_context["canonical_code"] = winner.code
         shared_context["current_round"] = self.current_round
         
@@ -1318,7 +1352,7 @@ Next round: Build upon the winning approach!
         }
         shared_context["subtask_history"].append(winner_info)
         
-        await self.shared_memory.write("project_context", shared_context)
+        await self._write_context(shared_context)
         
         # Save canonical code to artifacts
         await self.artifact_manager.save_canonical_code(
@@ -1357,8 +1391,8 @@ Next round: Build upon the winning approach!
     async def _integrate_winning_code(self, agent_result: AgentWorkResult, 
                                     winner: AgentWorkResult) -> str:
         """Integrate winning code with agent's own style using Letta AI."""
-        if agent_result.agent_name == winner.agent_name:
-            # Winner keeps their own code
+        if agent_result.agent_name == winner.agent_name or agent_result.code == winner.code:
+            # Winner (or an identical submission) keeps its own code - nothing to integrate
             return agent_result.code
         
         integration_prompt = f"""
@@ -1393,19 +1427,9 @@ Don't copy their code - enhance YOURS with their techniques!
 """
         
         try:
-            response = self.client.agents.messages.create(
-                agent_id=agent_result.agent_id,
-                messages=[{"role": "user", "content": integration_prompt}]
-            )
-            
-            integrated_code = ""
-            if hasattr(response, 'messages') and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, 'content') and msg.content:
-                        integrated_code = msg.content.strip()
-                        break
+            response = await self._letta_create(agent_result.agent_id, integration_prompt)
             
-            return integrated_code if integrated_code else agent_result.code
+            return first_content(response) or agent_result.code
             
         except Exception as e:
             print(f"❌ Code integration failed for {agent_result.agent_name}: {e}")
@@ -1413,26 +1437,32 @@ Don't copy their code - enhance YOURS with their techniques!
     
     async def _complete_project(self, agents: List[Any], commentator):
         """Complete the project and provide final summary."""
-        print(f"\n🎉 PROJECT COMPLETED!")
-        print(f"📊 Final Statistics:")
-        
+        lines = [f"\n🎉 PROJECT COMPLETED!", f"📊 Final Statistics:"]
         for agent_name, stats in self.agent_stats.items():
             win_rate = (stats["wins"] / stats["total_rounds"] * 100) if stats["total_rounds"] > 0 else 0
-            print(f"  • {agent_name}: {stats['wins']}/{stats['total_rounds']} wins ({win_rate:.1f}%)")
+            lines.append(f"  • {agent_name}: {stats['wins']}/{stats['total_rounds']} wins ({win_rate:.1f}%)")
+        print("\n".join(lines))
         
-        # Get final artifacts
-        final_artifacts = await self.artifact_manager.get_final_artifacts(self.current_project_id)
+        # Fetch final artifacts and mark the project completed concurrently
+        final_artifacts, _ = await asyncio.gather(
+            self.artifact_manager.get_final_artifacts(self.current_project_id),
+            self._mark_project_completed()
+        )
         print(f"  • {len(final_artifacts)} final artifacts created")
         
-        # Update project status
-        shared_context = await self.shared_memory.read("project_context") or {}
-        shared_context["completed"] = True
-        await self.shared_memory.write("project_context", shared_context)
+        # Let outstanding narration finish so the battle end is announced last
+        await self._drain_announcements()
         
         # Announce battle completion with voice commentary
         if self.voice_commentator:
             await self.voice_commentator.announce_battle_end(self.agent_stats)
     
+    async def _mark_project_completed(self):
+        """Flag the project as completed in shared memory."""
+        shared_context = await self._get_context()
+        shared_context["completed"] = True
+        await self._write_context(shared_context)
+    
     # REMOVED: _broadcast_progress method - now using smart batch commentary
     
     # REMOVED: Old real-time progress methods - now using smart batch commentary
@@ -0,0 +1,24 @@
+"""
+Event loop helpers shared by the CLI, the API wrapper and the Flask server.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+
+def get_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return uvloop's loop factory when installed, else None for the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run_coroutine(coro: Awaitable[Any]) -> Any:
+    """Run a coroutine to completion on a fresh loop owned by the calling thread.
+    
+    Each caller (e.g. each Flask request thread) gets its own loop, so a coroutine that
+    still makes blocking calls only holds up its own request.
+    """
+    with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+        return runner.run(coro)
@@ -0,0 +1,43 @@
+"""
+Shared HTTP session for outbound API calls (ElevenLabs TTS).
+"""
+import functools
+from types import MappingProxyType
+from typing import Mapping
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Retry transient provider errors (rate limits, gateway blips) a couple of times with a short,
+# bounded backoff. Retry-After is ignored so a 429 can't park the caller for an arbitrary time.
+RETRY_POLICY = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    respect_retry_after_header=False,
+    raise_on_status=False
+)
+
+# (connect, read) timeout in seconds for each TTS request attempt
+TTS_TIMEOUT = (3.05, 20)
+
+
+@functools.cache
+def get_http_session() -> requests.Session:
+    """Process-wide requests.Session so repeated calls reuse keep-alive connections."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=RETRY_POLICY))
+    return session
+
+
+@functools.lru_cache(maxsize=8)
+def elevenlabs_headers(api_key: str) -> Mapping[str, str]:
+    """Read-only ElevenLabs TTS headers, built once per API key."""
+    return MappingProxyType({
+        "Accept": "audio/mpeg",
+        "Content-Type": "application/json",
+        "xi-api-key": api_key
+    })
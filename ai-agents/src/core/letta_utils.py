@@ -0,0 +1,26 @@
+"""
+Helpers for reading Letta API responses.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib decoder
+    orjson = None
+
+
+def first_content(response, default: str = "") -> str:
+    """Return the first non-empty message content from a Letta response, stripped."""
+    for msg in getattr(response, "messages", None) or ():
+        content = getattr(msg, "content", None)
+        if content:
+            return content.strip()
+    return default
+
+
+def loads_content(content: str) -> Any:
+    """Decode a JSON reply, using orjson when available (raises json.JSONDecodeError either way)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
@@ -2,13 +2,33 @@
 Logging system for the Letta AI Agent PM Simulator.
 Captures agent activities, messages, artifacts, and system events.
 """
+import atexit
 import logging
+import logging.handlers
 import json
 import os
+import queue
+import sys
+import threading
+import time
 from datetime import datetime
 from typing import Dict, Any, List
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
+
+SESSION_FLUSH_INTERVAL = 1.0  # Minimum seconds between session JSON rewrites
+
+
+def configure_console() -> None:
+    """Write console output as UTF-8 so emoji status lines don't go through a legacy codepage."""
+    for stream in (sys.stdout, sys.stderr):
+        if hasattr(stream, "reconfigure") and (stream.encoding or "").lower() != "utf-8":
+            stream.reconfigure(encoding="utf-8", errors="replace")
+
 class PMSimulatorLogger:
     """Centralized logging for the PM Simulator."""
     
@@ -34,6 +54,11 @@ class PMSimulatorLogger:
             "messages": [],
             "events": []
         }
+        self._last_session_save = 0.0
+        self._session_dirty = False
+        self._flush_timer = None  # Writes the tail of a burst once the flush interval has passed
+        # Guards session_data against the flush timer thread serializing it mid-update
+        self._session_lock = threading.RLock()
     
     def _setup_logging(self):
         """Setup the logging configuration."""
@@ -52,48 +77,77 @@ class PMSimulatorLogger:
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
         
+        # File/console writes happen on a listener thread so logging never blocks the event loop
+        log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.close)
+        
         # Setup root logger
         self.logger = logging.getLogger('pm_simulator')
         self.logger.setLevel(logging.DEBUG)
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # The logger is process-global: replace an earlier instance's queue handler rather than
+        # stacking another one, so each record is queued exactly once
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                self.logger.removeHandler(handler)
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        self.logger.addHandler(self._queue_handler)
         
         # Prevent duplicate logs
         self.logger.propagate = False
     
+    def close(self):
+        """Write any pending session data, flush queued log records and stop the listener thread."""
+        with self._session_lock:
+            if self._session_dirty:
+                self._save_session_data(force=True)
+        if self._listener is not None:
+            # Detach first so nothing is queued after the listener has drained and stopped
+            self.logger.removeHandler(self._queue_handler)
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+    
     def log_session_start(self, project_description: str):
         """Log the start of a new simulation session."""
-        self.session_data["project_description"] = project_description
+        with self._session_lock:
+            self.session_data["project_description"] = project_description
         self.logger.info(f"🚀 Starting PM Simulator Session")
         self.logger.info(f"📋 Project: {project_description}")
         self._save_session_data()
     
     def log_agent_initialization(self, agent_id: str, agent_name: str, agent_type: str):
         """Log agent initialization."""
-        self.session_data["agents"][agent_id] = {
-            "name": agent_name,
-            "type": agent_type,
-            "initialized_at": datetime.now().isoformat(),
-            "activities": [],
-            "artifacts_created": 0,
-            "messages_sent": 0,
-            "messages_received": 0
-        }
+        with self._session_lock:
+            self.session_data["agents"][agent_id] = {
+                "name": agent_name,
+                "type": agent_type,
+                "initialized_at": datetime.now().isoformat(),
+                "activities": [],
+                "artifacts_created": 0,
+                "messages_sent": 0,
+                "messages_received": 0
+            }
         
         self.logger.info(f"🤖 Initialized {agent_type}: {agent_name} ({agent_id})")
         self._save_session_data()
     
     def log_task_distribution(self, tasks: Dict[str, str]):
         """Log task distribution to agents."""
-        self.session_data["tasks"] = [
-            {
-                "agent_id": agent_id,
-                "task": task,
-                "assigned_at": datetime.now().isoformat(),
-                "status": "assigned"
-            }
-            for agent_id, task in tasks.items()
-        ]
+        with self._session_lock:
+            self.session_data["tasks"] = [
+                {
+                    "agent_id": agent_id,
+                    "task": task,
+                    "assigned_at": datetime.now().isoformat(),
+                    "status": "assigned"
+                }
+                for agent_id, task in tasks.items()
+            ]
         
         self.logger.info("📝 Task Distribution:")
         for agent_id, task in tasks.items():
@@ -112,8 +166,9 @@ class PMSimulatorLogger:
             "details": details or {}
         }
         
-        if agent_id in self.session_data["agents"]:
-            self.session_data["agents"][agent_id]["activities"].append(activity_log)
+        with self._session_lock:
+            if agent_id in self.session_data["agents"]:
+                self.session_data["agents"][agent_id]["activities"].append(activity_log)
         
         agent_name = self.session_data["agents"].get(agent_id, {}).get("name", agent_id)
         self.logger.info(f"🎯 {agent_name}: {activity}")
@@ -136,13 +191,14 @@ class PMSimulatorLogger:
             "type": message_type
         }
         
-        self.session_data["messages"].append(message_log)
-        
-        # Update agent message counts
-        if from_agent in self.session_data["agents"]:
-            self.session_data["agents"][from_agent]["messages_sent"] += 1
-        if to_agent in self.session_data["agents"]:
-            self.session_data["agents"][to_agent]["messages_received"] += 1
+        with self._session_lock:
+            self.session_data["messages"].append(message_log)
+            
+            # Update agent message counts
+            if from_agent in self.session_data["agents"]:
+                self.session_data["agents"][from_agent]["messages_sent"] += 1
+            if to_agent in self.session_data["agents"]:
+                self.session_data["agents"][to_agent]["messages_received"] += 1
         
         from_name = self.session_data["agents"].get(from_agent, {}).get("name", from_agent)
         to_name = self.session_data["agents"].get(to_agent, {}).get("name", to_agent)
@@ -162,11 +218,12 @@ class PMSimulatorLogger:
             "description": description
         }
         
-        self.session_data["artifacts"].append(artifact_log)
-        
-        # Update agent artifact count
-        if agent_id in self.session_data["agents"]:
-            self.session_data["agents"][agent_id]["artifacts_created"] += 1
+        with self._session_lock:
+            self.session_data["artifacts"].append(artifact_log)
+            
+            # Update agent artifact count
+            if agent_id in self.session_data["agents"]:
+                self.session_data["agents"][agent_id]["artifacts_created"] += 1
         
         agent_name = self.session_data["agents"].get(agent_id, {}).get("name", agent_id)
         self.logger.info(f"📦 {agent_name} created {artifact_type} artifact: {artifact_id}")
@@ -194,7 +251,8 @@ class PMSimulatorLogger:
             "content": content
         }
         
-        self.session_data["events"].append(narration_log)
+        with self._session_lock:
+            self.session_data["events"].append(narration_log)
         self.logger.info(f"🎙️  Commentator: {content}")
         self._save_session_data()
     
@@ -209,7 +267,8 @@ class PMSimulatorLogger:
             "details": details or {}
         }
         
-        self.session_data["events"].append(event_log)
+        with self._session_lock:
+            self.session_data["events"].append(event_log)
         self.logger.info(f"⚙️  System: {event}")
         
         if details:
@@ -229,7 +288,8 @@ class PMSimulatorLogger:
             "details": details or {}
         }
         
-        self.session_data["events"].append(error_log)
+        with self._session_lock:
+            self.session_data["events"].append(error_log)
         self.logger.error(f"❌ Error: {error}")
         
         if details:
@@ -240,8 +300,9 @@ class PMSimulatorLogger:
     
     def log_session_end(self, status: str = "completed"):
         """Log the end of a simulation session."""
-        self.session_data["end_time"] = datetime.now().isoformat()
-        self.session_data["final_status"] = status
+        with self._session_lock:
+            self.session_data["end_time"] = datetime.now().isoformat()
+            self.session_data["final_status"] = status
         
         # Calculate session statistics
         total_artifacts = sum(agent.get("artifacts_created", 0) for agent in self.session_data["agents"].values())
@@ -255,15 +316,47 @@ class PMSimulatorLogger:
         self.logger.info(f"  • Messages: {total_messages}")
         self.logger.info(f"  • Events: {total_events}")
         
-        self._save_session_data()
+        self._save_session_data(force=True)
+    
+    def _save_session_data(self, force: bool = False):
+        """Save session data to JSON file, coalescing bursts of updates into one rewrite."""
+        with self._session_lock:
+            now = time.monotonic()
+            wait = SESSION_FLUSH_INTERVAL - (now - self._last_session_save)
+            if not force and wait > 0:
+                self._session_dirty = True
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(wait, self._flush_session_data)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._last_session_save = now
+            self._session_dirty = False
+            try:
+                if orjson is not None:
+                    # Same JSON as the fallback: non-str keys and unknown types (datetimes included) become strings
+                    self.session_file.write_bytes(orjson.dumps(
+                        self.session_data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+                        default=str
+                    ))
+                else:
+                    with open(self.session_file, 'w') as f:
+                        json.dump(self.session_data, f, indent=2, default=str)
+            except Exception as e:
+                self.logger.error(f"Failed to save session data: {e}")
     
-    def _save_session_data(self):
-        """Save session data to JSON file."""
-        try:
-            with open(self.session_file, 'w') as f:
-                json.dump(self.session_data, f, indent=2)
-        except Exception as e:
-            self.logger.error(f"Failed to save session data: {e}")
+    def _flush_session_data(self):
+        """Write the updates deferred by the last burst (runs on the flush timer thread)."""
+        with self._session_lock:
+            if self._flush_timer is not threading.current_thread():
+                return  # A newer save already superseded this timer
+            self._flush_timer = None
+            if self._session_dirty:
+                self._save_session_data(force=True)
     
     def get_session_summary(self) -> Dict[str, Any]:
         """Get a summary of the current session."""
@@ -3,6 +3,7 @@ Message system for agent-to-agent communication with history tracking.
 """
 from typing import Dict, List, Optional, Any
 import asyncio
+from collections import Counter
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
@@ -19,7 +20,7 @@ class MessageType(Enum):
     AGREEMENT = "agreement"
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a message between agents."""
     id: str
@@ -55,10 +56,10 @@ class MessageBroker:
         self._lock = asyncio.Lock()
         self._message_counter = 0
     
-    def _generate_message_id(self) -> str:
+    def _generate_message_id(self, timestamp: datetime) -> str:
         """Generate unique message ID."""
         self._message_counter += 1
-        return f"msg_{self._message_counter}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        return f"msg_{self._message_counter}_{timestamp:%Y%m%d_%H%M%S}"
     
     async def send_message(
         self, 
@@ -69,14 +70,15 @@ class MessageBroker:
         metadata: Optional[Dict[str, Any]] = None
     ) -> str:
         """Send a message from one agent to another."""
-        message_id = self._generate_message_id()
+        timestamp = datetime.now()
+        message_id = self._generate_message_id(timestamp)
         message = Message(
             id=message_id,
             from_agent=from_agent,
             to_agent=to_agent,
             content=content,
             message_type=message_type,
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             metadata=metadata
         )
         
@@ -98,14 +100,15 @@ class MessageBroker:
         metadata: Optional[Dict[str, Any]] = None
     ) -> str:
         """Broadcast a message to all agents."""
-        message_id = self._generate_message_id()
+        timestamp = datetime.now()
+        message_id = self._generate_message_id(timestamp)
         message = Message(
             id=message_id,
             from_agent=from_agent,
             to_agent=None,  # None indicates broadcast
             content=content,
             message_type=message_type,
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             metadata=metadata
         )
         
@@ -123,10 +126,13 @@ class MessageBroker:
         async with self._lock:
             return self._agent_messages.get(agent_id, []).copy()
     
-    async def get_recent_messages(self, agent_id: str, limit: int = 10) -> List[Message]:
-        """Get recent messages for an agent."""
-        messages = await self.get_messages(agent_id)
-        return messages[-limit:] if messages else []
+    async def get_recent_messages(self, agent_id: Optional[str] = None, limit: int = 10) -> List[Message]:
+        """Get recent messages for an agent, or across all agents if agent_id is None."""
+        if limit <= 0:
+            return []
+        async with self._lock:
+            messages = self._messages if agent_id is None else self._agent_messages.get(agent_id, [])
+            return messages[-limit:]
     
     async def get_messages_by_type(
         self, 
@@ -134,8 +140,8 @@ class MessageBroker:
         message_type: MessageType
     ) -> List[Message]:
         """Get messages of a specific type for an agent."""
-        messages = await self.get_messages(agent_id)
-        return [msg for msg in messages if msg.message_type == message_type]
+        async with self._lock:
+            return [msg for msg in self._agent_messages.get(agent_id, []) if msg.message_type == message_type]
     
     async def get_all_messages(self) -> List[Message]:
         """Get all messages (for commentator visibility)."""
@@ -163,16 +169,12 @@ class MessageBroker:
         async with self._lock:
             total_messages = len(self._messages)
             agent_counts = {agent_id: len(msgs) for agent_id, msgs in self._agent_messages.items()}
-            type_counts = {}
-            
-            for message in self._messages:
-                msg_type = message.message_type.value
-                type_counts[msg_type] = type_counts.get(msg_type, 0) + 1
+            type_counts = Counter(message.message_type.value for message in self._messages)
             
             return {
                 "total_messages": total_messages,
                 "agent_message_counts": agent_counts,
-                "message_type_counts": type_counts,
+                "message_type_counts": dict(type_counts),
                 "unique_agents": len(self._agent_messages)
             }
 
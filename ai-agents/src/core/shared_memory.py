@@ -14,13 +14,14 @@ class SharedMemory:
     """
     
     def __init__(self):
+        now = datetime.now().isoformat()
         self._memory: Dict[str, Any] = {
             "current_task": None,
             "agent_statuses": {},
             "artifacts_metadata": {},
             "global_context": {},
-            "created_at": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat()
+            "created_at": now,
+            "last_updated": now
         }
         self._lock = asyncio.Lock()
     
@@ -46,12 +47,13 @@ class SharedMemory:
     
     async def update_agent_status(self, agent_id: str, status: Dict[str, Any]) -> None:
         """Update an agent's status in shared memory."""
+        now = datetime.now().isoformat()
         async with self._lock:
             self._memory["agent_statuses"][agent_id] = {
                 **status,
-                "last_updated": datetime.now().isoformat()
+                "last_updated": now
             }
-            self._memory["last_updated"] = datetime.now().isoformat()
+            self._memory["last_updated"] = now
     
     async def get_agent_status(self, agent_id: str) -> Optional[Dict[str, Any]]:
         """Get an agent's current status."""
@@ -60,12 +62,13 @@ class SharedMemory:
     
     async def update_artifact_metadata(self, agent_id: str, artifact_info: Dict[str, Any]) -> None:
         """Update artifact metadata for an agent."""
+        now = datetime.now().isoformat()
         async with self._lock:
             self._memory["artifacts_metadata"][agent_id] = {
                 **artifact_info,
-                "last_updated": datetime.now().isoformat()
+                "last_updated": now
             }
-            self._memory["last_updated"] = datetime.now().isoformat()
+            self._memory["last_updated"] = now
     
     async def get_artifact_metadata(self, agent_id: str) -> Optional[Dict[str, Any]]:
         """Get artifact metadata for an agent."""
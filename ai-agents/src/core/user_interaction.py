@@ -3,25 +3,31 @@ User Interaction Manager - Handles user input and artifact display for competiti
 """
 
 import asyncio
+import functools
 import json
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.syntax import Syntax
 
-console = Console()
+@functools.cache
+def _get_console():
+    """Create the shared rich console on first use (rich is only imported when displaying)."""
+    from rich.console import Console
+    return Console()
 
 class UserInteractionManager:
     """Manages user interaction for competitive workflow."""
     
-    def __init__(self):
-        self.console = console
+    @property
+    def console(self):
+        """Shared rich console."""
+        return _get_console()
     
     async def display_round_options(self, project_id: str, round_num: int, 
                                   artifacts: List[Dict[str, Any]]) -> int:
         """Display round options to user and get their choice."""
+        from rich.syntax import Syntax
+        from rich.table import Table
+        
         self.console.print(f"\n{'='*80}")
         self.console.print(f"🎯 ROUND {round_num} - Choose Your Winner!", style="bold blue")
         self.console.print(f"{'='*80}")
@@ -52,10 +58,10 @@ class UserInteractionManager:
             
             code = artifact.get("code", "")
             if code:
-                # Show first 20 lines of code
-                code_lines = code.split('\n')[:20]
-                preview_code = '\n'.join(code_lines)
-                if len(code.split('\n')) > 20:
+                # Show first 20 lines of code (maxsplit leaves the rest unsplit in one tail item)
+                code_lines = code.split('\n', 20)
+                preview_code = '\n'.join(code_lines[:20])
+                if len(code_lines) > 20:
                     preview_code += "\n... (truncated)"
                 
                 syntax = Syntax(preview_code, "typescript", theme="monokai", line_numbers=True)
@@ -80,6 +86,8 @@ class UserInteractionManager:
     
     async def display_final_results(self, project_id: str, final_artifacts: List[Dict[str, Any]]):
         """Display final project results."""
+        from rich.table import Table
+        
         self.console.print(f"\n{'='*80}")
         self.console.print(f"🎉 PROJECT COMPLETED! - Final Results", style="bold green")
         self.console.print(f"{'='*80}")
@@ -140,8 +148,7 @@ class UserInteractionManager:
     
     async def _get_user_input(self, prompt: str) -> str:
         """Get user input asynchronously."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, input, prompt)
+        return await asyncio.to_thread(input, prompt)
     
     def display_project_structure(self, project_id: str):
         """Display the project folder structure."""
@@ -6,10 +6,15 @@ Provides rich context snapshots to enable intelligent voice commentary
 import asyncio
 import time
 import copy
-from typing import Dict, List, Any, Optional
+from collections import deque
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
 from dataclasses import dataclass
 
-@dataclass
+MAX_RECENT_EVENTS = 20  # Ring buffer size for the event timeline
+
+@dataclass(slots=True)
 class BattleEvent:
     """Represents a battle event"""
     event_type: str
@@ -29,11 +34,12 @@ class BattleContextManager:
             "agents_progress": {},
             "round_winners": [],
             "agent_stats": {},
-            "recent_events": [],
+            "recent_events": deque(maxlen=MAX_RECENT_EVENTS),
             "battle_start_time": None,
             "total_rounds": 0
         }
         self._lock = asyncio.Lock()
+        self._snapshot = None  # Cached read-only deep copy, invalidated on every state change
     
     async def initialize_battle(self, project_id: str, project_description: str, total_rounds: int = 4):
         """Initialize a new battle"""
@@ -46,7 +52,7 @@ class BattleContextManager:
                 "agents_progress": {},
                 "round_winners": [],
                 "agent_stats": {},
-                "recent_events": [],
+                "recent_events": deque(maxlen=MAX_RECENT_EVENTS),
                 "battle_start_time": time.time(),
                 "total_rounds": total_rounds
             }
@@ -102,7 +108,7 @@ class BattleContextManager:
             
             completion_entry = {
                 "status": "completed",
-                "code_lines": len(work_result.get("code", "").split('\n')),
+                "code_lines": work_result.get("code", "").count('\n') + 1,
                 "timestamp": time.time(),
                 "completion_time": time.time() - self.state["current_subtask"]["start_time"]
             }
@@ -148,19 +154,21 @@ class BattleContextManager:
             message=message
         )
         
+        # Bounded deque drops the oldest event itself, no re-slicing
         self.state["recent_events"].append(event)
-        
-        # Keep only last 20 events to prevent memory bloat
-        if len(self.state["recent_events"]) > 20:
-            self.state["recent_events"] = self.state["recent_events"][-20:]
+        self._snapshot = None
     
-    def get_snapshot(self) -> Dict[str, Any]:
-        """Get current battle state snapshot (thread-safe copy)"""
-        return copy.deepcopy(self.state)
+    def get_snapshot(self) -> Mapping[str, Any]:
+        """Get current battle state snapshot (read-only view of a copy shared until the state changes)"""
+        # Callers only read it; the proxy stops one of them rebinding keys under the others
+        if self._snapshot is None:
+            self._snapshot = MappingProxyType(copy.deepcopy(self.state))
+        return self._snapshot
     
     def get_context_summary(self) -> str:
         """Get formatted context summary for commentator"""
-        snapshot = self.get_snapshot()
+        # Read-only formatting with no awaits, so the live state needs no copy
+        snapshot = self.state
         
         summary = f"""
 CURRENT BATTLE STATE:
@@ -185,7 +193,7 @@ BATTLE STATS:
 """
         return summary.strip()
     
-    def _format_agent_progress(self, snapshot: Dict[str, Any]) -> str:
+    def _format_agent_progress(self, snapshot: Mapping[str, Any]) -> str:
         """Format agent progress for context"""
         progress_lines = []
         
@@ -206,7 +214,7 @@ BATTLE STATS:
         
         return "\n".join(progress_lines) if progress_lines else "No progress yet"
     
-    def _format_leaderboard(self, snapshot: Dict[str, Any]) -> str:
+    def _format_leaderboard(self, snapshot: Mapping[str, Any]) -> str:
         """Format leaderboard for context"""
         stats = snapshot["agent_stats"]
         if not stats:
@@ -224,9 +232,10 @@ BATTLE STATS:
         
         return "\n".join(leaderboard_lines)
     
-    def _format_recent_events(self, snapshot: Dict[str, Any], limit: int = 5) -> str:
+    def _format_recent_events(self, snapshot: Mapping[str, Any], limit: int = 5) -> str:
         """Format recent events"""
-        events = snapshot["recent_events"][-limit:]
+        recent_events = snapshot["recent_events"]
+        events = islice(recent_events, max(0, len(recent_events) - limit), None)
         event_lines = []
         
         for event in events:
@@ -235,7 +244,7 @@ BATTLE STATS:
         
         return "\n".join(event_lines) if event_lines else "No recent events"
     
-    def _format_duration(self, snapshot: Dict[str, Any]) -> str:
+    def _format_duration(self, snapshot: Mapping[str, Any]) -> str:
         """Format battle duration"""
         if not snapshot["battle_start_time"]:
             return "Unknown"
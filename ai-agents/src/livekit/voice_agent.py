@@ -4,14 +4,17 @@ Voice Agent - Individual agent voice wrapper for personality-driven responses.
 
 import asyncio
 import time
-from typing import Dict, Any, Optional
-from letta_client import Letta
+from typing import Dict, Any, Optional, TYPE_CHECKING
+from src.core.letta_utils import first_content
 from src.livekit.agent_voices import get_agent_voice_config, get_agent_prompt_template, calculate_emotion_level
 
+if TYPE_CHECKING:
+    from letta_client import Letta
+
 class VoiceAgent:
     """Individual agent voice wrapper for personality-driven responses."""
     
-    def __init__(self, agent_name: str, letta_agent_id: str, letta_client: Letta):
+    def __init__(self, agent_name: str, letta_agent_id: str, letta_client: "Letta"):
         self.agent_name = agent_name
         self.letta_agent_id = letta_agent_id
         self.client = letta_client
@@ -40,11 +43,7 @@ class VoiceAgent:
             )
             
             # Extract response content
-            response_text = f"Agent {self.agent_name} reacts..."
-            for msg in response.messages:
-                if hasattr(msg, 'content'):
-                    response_text = msg.content.strip()
-                    break
+            response_text = first_content(response, f"Agent {self.agent_name} reacts...")
             
             # Calculate emotion level based on battle state
             battle_state = {
@@ -95,11 +94,7 @@ class VoiceAgent:
             )
             
             # Extract response content
-            response_text = f"Agent {self.agent_name} is thinking..."
-            for msg in response.messages:
-                if hasattr(msg, 'content'):
-                    response_text = msg.content.strip()
-                    break
+            response_text = first_content(response, f"Agent {self.agent_name} is thinking...")
             
             # Calculate emotion level based on battle state
             battle_state = {
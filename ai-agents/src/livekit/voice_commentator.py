@@ -5,9 +5,10 @@ The "nervous system" that bridges intelligent commentary with voice output
 
 import asyncio
 import time
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Mapping, Optional, Union
 from livekit import rtc
 from src.livekit.battle_context import BattleContextManager
+from src.core.letta_utils import first_content
 from src.livekit.voice_pipeline import voice_pipeline
 from config.livekit_config import livekit_config
 
@@ -81,7 +82,7 @@ class VoiceCommentator:
             print(f"❌ User question handling failed: {e}")
             return None
     
-    async def _generate_commentary(self, event: str, context: Dict[str, Any]) -> str:
+    async def _generate_commentary(self, event: str, context: Mapping[str, Any]) -> str:
         """Ask Letta to generate commentary for specific events"""
         
         # Build context-rich prompt
@@ -105,13 +106,9 @@ class VoiceCommentator:
         )
         
         # Extract text
-        for msg in response.messages:
-            if hasattr(msg, 'content'):
-                return msg.content.strip()
-        
-        return "The battle continues with excitement!"
+        return first_content(response, "The battle continues with excitement!")
     
-    async def _answer_question(self, question: str, context: Dict[str, Any]) -> str:
+    async def _answer_question(self, question: str, context: Mapping[str, Any]) -> str:
         """Ask Letta to answer user question with battle context"""
         
         context_summary = self.context.get_context_summary()
@@ -138,10 +135,7 @@ Keep it 1-2 sentences.
             )
             
             # Extract response
-            for msg in response.messages:
-                if hasattr(msg, 'content'):
-                    response = msg.content.strip()
-                    break
+            response = first_content(response) or response
         
         return response if isinstance(response, str) else "Great question! The battle is heating up!"
     
@@ -5,10 +5,10 @@ Uses LiveKit's unified model interface instead of direct OpenAI API calls
 
 import asyncio
 import os
-import requests
 from typing import Optional, Union
 from livekit.agents import AgentSession
 from config.livekit_config import livekit_config
+from src.core.http_session import TTS_TIMEOUT, elevenlabs_headers, get_http_session
 
 class VoicePipeline:
     """Handles TTS/STT operations using LiveKit Inference"""
@@ -54,12 +54,6 @@ class VoicePipeline:
             # ElevenLabs API endpoint
             url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
             
-            headers = {
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json",
-                "xi-api-key": api_key
-            }
-            
             data = {
                 "text": text,
                 "model_id": "eleven_turbo_v2_5",
@@ -69,8 +63,15 @@ class VoicePipeline:
                 }
             }
             
-            # Make request to ElevenLabs
-            response = requests.post(url, json=data, headers=headers)
+            # Make request to ElevenLabs off the event loop, so a slow or retried call
+            # doesn't freeze the round
+            response = await asyncio.to_thread(
+                get_http_session().post,
+                url,
+                json=data,
+                headers=elevenlabs_headers(api_key),
+                timeout=TTS_TIMEOUT
+            )
             
             if response.status_code == 200:
                 return response.content